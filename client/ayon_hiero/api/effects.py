@@ -0,0 +1,187 @@
+"""Encoding of soft effects data published by `ExtractClipEffects`.
+
+Schema version 1 stores animated knobs as dense lists with value for
+each frame, vector knobs have list of channel values per frame.
+
+Schema version 2 is marked by `schemaVersion` key and stores animated
+knobs as keyframes of each channel:
+
+    {"keys": [[frame_index, value], ...]}
+    {"channelKeys": [[[frame_index, value], ...], ...]}
+
+Frame indexes are relative to first frame of the dense animation, so
+both versions are applied to the same frames.
+"""
+
+SCHEMA_VERSION_KEY = "schemaVersion"
+EFFECTS_SCHEMA_VERSION = 2
+
+
+def get_schema_version(effects):
+    """Get schema version of effects data.
+
+    Args:
+        effects (Mapping): effects data
+
+    Returns:
+        int: schema version
+    """
+    return effects.get(SCHEMA_VERSION_KEY, 1)
+
+
+def is_dense_animation(knob_value):
+    """Knob value is animation stored as value per frame.
+
+    List with up to 4 values is not animation, it could be RGBA or vector.
+    """
+    return isinstance(knob_value, list) and len(knob_value) > 4
+
+
+def is_keys_animation(knob_value):
+    """Knob value is animation stored as keyframes."""
+    return isinstance(knob_value, dict) and (
+        "keys" in knob_value or "channelKeys" in knob_value
+    )
+
+
+def get_animation_channels(knob_value):
+    """Split dense knob animation to per channel values.
+
+    Args:
+        knob_value (list): value per frame, vector knobs have list
+            of channel values per frame
+
+    Returns:
+        list[tuple[Optional[int], list]]: channel index (None for
+            single value knobs) with values per frame
+    """
+    if not isinstance(knob_value[0], list):
+        return [(None, knob_value)]
+
+    return [
+        (channel, [value[channel] for value in knob_value])
+        for channel in range(len(knob_value[0]))
+    ]
+
+
+def get_animation_keys(knob_value):
+    """Get keyframes of each channel of keyframed knob animation.
+
+    Args:
+        knob_value (dict): animation stored as keyframes
+
+    Returns:
+        list[tuple[Optional[int], list[tuple[int, Any]]]]: channel index
+            (None for single value knobs) with frame index and value
+            of each keyframe
+    """
+    if "keys" in knob_value:
+        return [(None, knob_value["keys"])]
+
+    return list(enumerate(knob_value["channelKeys"]))
+
+
+def get_keyframe_indexes(values, tolerance):
+    """Get indexes of values which has to be kept as keyframes.
+
+    Runs of constant or linearly changing values are collapsed to
+    their boundaries. Each boundary keeps also its neighbour inside
+    the run so the curve stays straight between keys regardless of
+    interpolation of keys set by `setValueAt`, which derives key
+    slopes from neighbouring keys.
+
+    Args:
+        values (list): value per frame
+        tolerance (float): maximal allowed difference of dropped
+            value from line between run boundaries
+
+    Returns:
+        list[int]: sorted indexes of keyframes
+    """
+    last_index = len(values) - 1
+    if last_index < 3 or not all(
+        isinstance(value, (int, float)) for value in values
+    ):
+        return list(range(len(values)))
+
+    boundaries = [0]
+    start = 0
+    while start < last_index:
+        # slopes from start value which keep all values in run
+        #   within tolerance
+        min_slope = float("-inf")
+        max_slope = float("inf")
+        end = start + 1
+        for index in range(start + 1, last_index + 1):
+            distance = index - start
+            slope = (values[index] - values[start]) / distance
+            if min_slope <= slope <= max_slope:
+                end = index
+            min_slope = max(
+                min_slope,
+                (values[index] - tolerance - values[start]) / distance
+            )
+            max_slope = min(
+                max_slope,
+                (values[index] + tolerance - values[start]) / distance
+            )
+            if min_slope > max_slope:
+                break
+        boundaries.append(end)
+        start = end
+
+    keyframes = set()
+    for index in boundaries:
+        keyframes.update((index - 1, index, index + 1))
+    return sorted(
+        index for index in keyframes
+        if 0 <= index <= last_index
+    )
+
+
+def encode_effects(effects, tolerance):
+    """Convert effects data to schema version 2.
+
+    Args:
+        effects (dict): effects data of schema version 1
+        tolerance (float): tolerance of keyframe reduction
+
+    Returns:
+        dict: effects data of schema version 2
+    """
+    encoded = {SCHEMA_VERSION_KEY: EFFECTS_SCHEMA_VERSION}
+    for name, effect in effects.items():
+        if not isinstance(effect, dict) or "node" not in effect:
+            encoded[name] = effect
+            continue
+
+        node = {}
+        for knob_name, knob_value in effect["node"].items():
+            if is_dense_animation(knob_value):
+                knob_value = encode_animation(knob_value, tolerance)
+            node[knob_name] = knob_value
+
+        encoded[name] = dict(effect, node=node)
+    return encoded
+
+
+def encode_animation(knob_value, tolerance):
+    """Convert dense knob animation to keyframes.
+
+    Args:
+        knob_value (list): value per frame
+        tolerance (float): tolerance of keyframe reduction
+
+    Returns:
+        dict: animation stored as keyframes
+    """
+    channels_keys = []
+    for _, values in get_animation_channels(knob_value):
+        channels_keys.append([
+            [index, values[index]]
+            for index in get_keyframe_indexes(values, tolerance)
+        ])
+
+    if not isinstance(knob_value[0], list):
+        return {"keys": channels_keys[0]}
+    return {"channelKeys": channels_keys}
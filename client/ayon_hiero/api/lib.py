@@ -26,7 +26,7 @@ from ayon_core.pipeline import (
 )
 from ayon_core.pipeline.load import filter_containers
 from ayon_core.lib import Logger
-from . import tags
+from . import tags, media_cache
 from .constants import (
     AYON_TAG_NAME,
     DEFAULT_SEQUENCE_NAME,
@@ -844,10 +844,23 @@ def create_nuke_workfile_clips(nuke_workfiles, seq=None):
         else:
             track = seq.tracks(nk['task'])
 
-        # create clip media
-        media = hiero.core.MediaSource(nk['path'])
-        media_in = int(media.startTime() or 0)
-        media_duration = int(media.duration() or 0)
+        name = os.path.basename(os.path.splitext(nk['path'])[0])
+        split_name = split_by_client_version(name)[0] or name
+        items_in_bin = [b.name() for b in bin.items()]
+
+        # media of clip which is already in bin are not probed again
+        # if their information is cached
+        media_info = None
+        if split_name in items_in_bin:
+            media_info = media_cache.get_cached_media_info(nk['path'])
+
+        if media_info is None:
+            # create clip media
+            media = hiero.core.MediaSource(nk['path'])
+            media_info = media_cache.cache_media_source(nk['path'], media)
+
+        media_in = media_info["startTime"]
+        media_duration = media_info["duration"]
 
         handle_start = nk.get("handleStart")
         handle_end = nk.get("handleEnd")
@@ -862,14 +875,9 @@ def create_nuke_workfile_clips(nuke_workfiles, seq=None):
         else:
             source_out = nk["frameEnd"] - handle_end
 
-        source = hiero.core.Clip(media)
-
-        name = os.path.basename(os.path.splitext(nk['path'])[0])
-        split_name = split_by_client_version(name)[0] or name
-
         # add to bin as clip item
-        items_in_bin = [b.name() for b in bin.items()]
         if split_name not in items_in_bin:
+            source = hiero.core.Clip(media)
             binItem = hiero.core.BinItem(source)
             bin.addItem(binItem)
 
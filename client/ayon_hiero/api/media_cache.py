@@ -0,0 +1,287 @@
+"""Persistent cache of media probe results.
+
+Probing media through `hiero.core.MediaSource` or listing directories on
+network storage is slow and the same published media are probed again in
+every session. Results are stored in SQLite database in AYON local
+directory and are keyed by media path and modification time of its
+directory, so adding or removing files invalidates the cached values.
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from ayon_core.lib import Logger
+
+try:
+    from ayon_core.lib import get_launcher_local_dir
+except ImportError:
+    # older ayon-core
+    from ayon_core.lib import get_ayon_appdirs as get_launcher_local_dir
+
+
+log = Logger.get_logger(__name__)
+
+CACHE_FILENAME = "hiero_media_cache.db"
+# Maximum number of cached entries, least recently used are evicted
+MAX_ENTRIES = 50000
+# Number of writes after which cache size is checked
+EVICTION_INTERVAL = 500
+# Number of paths looked up by one query, below SQLite variables limit
+QUERY_CHUNK_SIZE = 500
+
+
+class _CTX:
+    cache = None
+
+
+class MediaProbeCache:
+    """SQLite cache of media probe data.
+
+    Each entry is stored per category so different probes of the same
+    path (e.g. directory listing and `MediaSource` info) do not override
+    each other.
+
+    Args:
+        db_path (str): path to SQLite database file
+        max_entries (Optional[int]): maximum number of cached entries
+    """
+
+    def __init__(self, db_path, max_entries=None):
+        self._db_path = db_path
+        self._max_entries = max_entries or MAX_ENTRIES
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        dirpath = os.path.dirname(db_path)
+        if dirpath:
+            os.makedirs(dirpath, exist_ok=True)
+
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS media_probe ("
+                " category TEXT NOT NULL,"
+                " path TEXT NOT NULL,"
+                " dir_mtime REAL NOT NULL,"
+                " data TEXT NOT NULL,"
+                " accessed REAL NOT NULL,"
+                " PRIMARY KEY (category, path))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS media_probe_accessed"
+                " ON media_probe (accessed)"
+            )
+
+    @staticmethod
+    def get_dir_mtime(path):
+        """Modification time of directory of media path.
+
+        Returns:
+            Optional[float]: mtime or None if directory does not exist
+        """
+        try:
+            return os.stat(os.path.dirname(path)).st_mtime
+        except OSError:
+            return None
+
+    def get(self, category, path, dir_mtime=None):
+        """Get cached data if directory of path did not change since.
+
+        Args:
+            category (str): probe category
+            path (str): media path
+            dir_mtime (Optional[float]): directory mtime if already known
+
+        Returns:
+            Optional[dict]: cached data or None
+        """
+        return self.get_many(category, [(path, dir_mtime)]).get(path)
+
+    def get_many(self, category, items):
+        """Get cached data of multiple paths with few queries.
+
+        Access time of all found entries is updated in one transaction.
+
+        Args:
+            category (str): probe category
+            items (Iterable[tuple[str, Optional[float]]]): path and
+                directory mtime of each path if already known
+
+        Returns:
+            dict[str, dict]: cached data by path, paths which are not
+                cached or changed since are not included
+        """
+        dir_mtime_by_path = {}
+        for path, dir_mtime in items:
+            if dir_mtime is None:
+                dir_mtime = self.get_dir_mtime(path)
+                if dir_mtime is None:
+                    continue
+            dir_mtime_by_path[path] = dir_mtime
+
+        paths = list(dir_mtime_by_path)
+        output = {}
+        with self._lock:
+            for start in range(0, len(paths), QUERY_CHUNK_SIZE):
+                chunk = paths[start:start + QUERY_CHUNK_SIZE]
+                rows = self._connection.execute(
+                    "SELECT path, dir_mtime, data FROM media_probe"
+                    " WHERE category = ? AND path IN ({})".format(
+                        ", ".join("?" * len(chunk))),
+                    [category] + chunk
+                ).fetchall()
+                for path, dir_mtime, data in rows:
+                    if dir_mtime == dir_mtime_by_path[path]:
+                        output[path] = json.loads(data)
+
+            if output:
+                now = time.time()
+                with self._connection:
+                    self._connection.executemany(
+                        "UPDATE media_probe SET accessed = ?"
+                        " WHERE category = ? AND path = ?",
+                        [(now, category, path) for path in output]
+                    )
+
+        return output
+
+    def set(self, category, path, data, dir_mtime=None):
+        """Store probe data of path.
+
+        Args:
+            category (str): probe category
+            path (str): media path
+            data (dict): json serializable probe data
+            dir_mtime (Optional[float]): directory mtime if already known
+        """
+        self.set_many(category, [(path, data, dir_mtime)])
+
+    def set_many(self, category, items):
+        """Store probe data of multiple paths in one transaction.
+
+        Args:
+            category (str): probe category
+            items (Iterable[tuple[str, dict, Optional[float]]]): path,
+                data and directory mtime of each path
+        """
+        now = time.time()
+        rows = []
+        for path, data, dir_mtime in items:
+            if dir_mtime is None:
+                dir_mtime = self.get_dir_mtime(path)
+                if dir_mtime is None:
+                    continue
+            rows.append((category, path, dir_mtime, json.dumps(data), now))
+
+        if not rows:
+            return
+
+        with self._lock:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO media_probe"
+                    " (category, path, dir_mtime, data, accessed)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+            self._writes += len(rows)
+            if self._writes >= EVICTION_INTERVAL:
+                self._writes = 0
+                self._evict()
+
+    def _evict(self):
+        count = self._connection.execute(
+            "SELECT COUNT(*) FROM media_probe").fetchone()[0]
+        overflow = count - self._max_entries
+        if overflow <= 0:
+            return
+
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM media_probe WHERE rowid IN ("
+                " SELECT rowid FROM media_probe"
+                " ORDER BY accessed ASC LIMIT ?)",
+                (overflow,)
+            )
+        log.debug("Evicted {} media probe cache entries".format(overflow))
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM media_probe")
+
+
+def get_media_cache():
+    """Get shared media probe cache.
+
+    Returns:
+        Optional[MediaProbeCache]: cache or None if it can't be opened
+    """
+    if _CTX.cache is None:
+        db_path = os.path.join(get_launcher_local_dir(), CACHE_FILENAME)
+        try:
+            _CTX.cache = MediaProbeCache(db_path)
+        except (OSError, sqlite3.Error):
+            log.warning(
+                "Media probe cache '{}' can't be used".format(db_path),
+                exc_info=True
+            )
+            # do not try again in this session
+            _CTX.cache = False
+
+    return _CTX.cache or None
+
+
+def get_media_source_info(media_source):
+    """Collect information of media source which are worth caching.
+
+    Args:
+        media_source (hiero.core.MediaSource): probed media source
+
+    Returns:
+        dict: media information
+    """
+    return {
+        "startTime": int(media_source.startTime() or 0),
+        "duration": int(media_source.duration() or 0),
+        "padding": int(media_source.filenamePadding() or 0),
+        "singleFile": bool(media_source.singleFile()),
+        "width": int(media_source.width()),
+        "height": int(media_source.height()),
+        "pixelAspect": float(media_source.pixelAspect()),
+    }
+
+
+def get_cached_media_info(path):
+    """Get cached media information of path.
+
+    Args:
+        path (str): media path
+
+    Returns:
+        Optional[dict]: media information stored by `cache_media_source`
+    """
+    cache = get_media_cache()
+    if cache is None:
+        return None
+    return cache.get("media_source", path)
+
+
+def cache_media_source(path, media_source):
+    """Store information of probed media source of path.
+
+    Args:
+        path (str): media path
+        media_source (hiero.core.MediaSource): probed media source
+
+    Returns:
+        dict: media information
+    """
+    media_info = get_media_source_info(media_source)
+    cache = get_media_cache()
+    if cache is not None and not media_source.isOffline():
+        cache.set("media_source", path, media_info)
+    return media_info
@@ -1,7 +1,7 @@
 """ compatibility OpenTimelineIO 0.12.0 and newer
 """
 
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 import os
 import re
 import opentimelineio as otio
@@ -22,12 +22,15 @@ MARKER_COLOR_MAP = {
     "cyan": otio.schema.MarkerColor.CYAN,
     "blue": otio.schema.MarkerColor.BLUE,
 }
+SOURCE_MARKERS_KEY = "ayon.source.markers"
 
 
 class CTX:
     project_fps = None
     timeline = None
     include_tags = True
+    source_markers_on_reference = False
+    source_markers = {}
 
 
 def flatten(list_):
@@ -213,7 +216,18 @@ def get_marker_color(tag):
     return otio.schema.MarkerColor.RED
 
 
-def create_otio_markers(otio_item, item):
+def get_otio_markers(item):
+    """Convert visible tags of Hiero item to otio markers.
+
+    Args:
+        item (hiero.core.TrackItem|hiero.core.Clip|hiero.core.Track): item
+            with tags
+
+    Returns:
+        list[otio.schema.Marker]: markers
+    """
+    markers = []
+    frame_rate = utils.get_rate(item) or CTX.project_fps
     for tag in item.tags():
         if not tag.visible():
             continue
@@ -222,7 +236,7 @@ def create_otio_markers(otio_item, item):
             # Hiero adds this tag to a lot of clips
             continue
 
-        frame_rate = utils.get_rate(item) or CTX.project_fps
+        tag_metadata = tag.metadata().dict()
 
         marked_range = otio.opentime.TimeRange(
             start_time=otio.opentime.RationalTime(
@@ -230,14 +244,14 @@ def create_otio_markers(otio_item, item):
                 frame_rate
             ),
             duration=otio.opentime.RationalTime(
-                int(tag.metadata().dict().get('tag.length', '0')),
+                int(tag_metadata.get('tag.length', '0')),
                 frame_rate
             )
         )
         # add tag metadata but remove "tag." string
         metadata = {}
 
-        for key, value in tag.metadata().dict().items():
+        for key, value in tag_metadata.items():
             _key = key.replace("tag.", "")
 
             metadata.update({_key: value})
@@ -251,10 +265,58 @@ def create_otio_markers(otio_item, item):
             marked_range=marked_range,
             metadata=metadata
         )
+        markers.append(marker)
+
+    return markers
+
+
+def _get_source_clip_key(clip):
+    if hasattr(clip, "guid"):
+        return clip.guid()
+
+    file_info = clip.mediaSource().fileinfos()[0]
+    return clip.name(), file_info.filename()
+
+
+def get_source_otio_markers(clip):
+    """Return otio markers of source clip.
 
+    Markers are built only once per source clip during timeline export
+    and reused by all track items sharing the clip.
+
+    Args:
+        clip (hiero.core.Clip): source clip
+
+    Returns:
+        list[otio.schema.Marker]: markers
+    """
+    key = _get_source_clip_key(clip)
+    markers = CTX.source_markers.get(key)
+    if markers is None:
+        markers = get_otio_markers(clip)
+        CTX.source_markers[key] = markers
+    return markers
+
+
+def create_otio_markers(otio_item, item):
+    for marker in get_otio_markers(item):
         otio_item.markers.append(marker)
 
 
+def create_otio_source_markers(otio_clip, clip):
+    markers = get_source_otio_markers(clip)
+    if not markers:
+        return
+
+    if CTX.source_markers_on_reference:
+        # keep source clip markers apart from track item markers
+        otio_clip.media_reference.metadata[SOURCE_MARKERS_KEY] = markers
+        return
+
+    for marker in markers:
+        otio_clip.markers.append(marker)
+
+
 def create_otio_clip(track_item):
     clip = track_item.source()
     speed = track_item.playbackSpeed()
@@ -290,7 +352,7 @@ def create_otio_clip(track_item):
     # Add tags as markers
     if CTX.include_tags:
         create_otio_markers(otio_clip, track_item)
-        create_otio_markers(otio_clip, track_item.source())
+        create_otio_source_markers(otio_clip, clip)
 
     # only if video
     if not clip.mediaSource().hasAudio():
@@ -374,61 +436,171 @@ def add_otio_metadata(otio_item, media_source, **kwargs):
         otio_item.metadata.update({key: value})
 
 
-def create_otio_timeline(
+def init_otio_timeline(
     sequence: Optional[hiero.core.Sequence] = None,
+    include_tags: bool = True,
+    source_markers_on_reference: bool = False,
 ) -> otio.schema.Timeline:
+    """Prepare export context and create otio timeline without tracks.
 
-    # get current timeline
-    CTX.timeline = sequence or hiero.ui.activeSequence()
-    CTX.project_fps = CTX.timeline.framerate().toFloat()
+    Export options are set on every call so options of one export do
+    not leak into following exports.
 
-    # convert timeline to otio
-    otio_timeline = _create_otio_timeline()
+    Args:
+        sequence (Optional[hiero.core.Sequence]): sequence to export,
+            active sequence is used if not defined
+        include_tags (bool): export tags of track items as markers
+        source_markers_on_reference (bool): export tags of source clips
+            as media reference metadata
 
-    # loop all defined track types
-    for track in CTX.timeline.items():
-        # skip if track is disabled
-        if not track.isEnabled():
-            continue
-
-        # convert track to otio
-        otio_track = create_otio_track(
-            type(track), track.name())
-
-        for itemindex, track_item in enumerate(track):
-            # Add Gap if needed
-            if itemindex == 0:
-                # if it is first track item at track then add
-                # it to previous item
-                prev_item = track_item
+    Returns:
+        otio.schema.Timeline: empty otio timeline
+    """
+    CTX.timeline = sequence or hiero.ui.activeSequence()
+    CTX.project_fps = CTX.timeline.framerate().toFloat()
+    CTX.include_tags = include_tags
+    CTX.source_markers_on_reference = source_markers_on_reference
+    CTX.source_markers = {}
+
+    return _create_otio_timeline()
+
+
+def get_export_context():
+    """Get state of current export prepared by `init_otio_timeline`.
+
+    Export which converts tracks over multiple calls has to restore its
+    state with `set_export_context` as other exports may prepare
+    context meanwhile.
+
+    Returns:
+        dict[str, Any]: export context values by name
+    """
+    return {
+        "timeline": CTX.timeline,
+        "project_fps": CTX.project_fps,
+        "include_tags": CTX.include_tags,
+        "source_markers_on_reference": CTX.source_markers_on_reference,
+        "source_markers": CTX.source_markers,
+    }
+
+
+def set_export_context(export_context):
+    """Restore export context stored by `get_export_context`.
+
+    Args:
+        export_context (dict[str, Any]): export context values by name
+    """
+    for key, value in export_context.items():
+        setattr(CTX, key, value)
+
+
+def get_exportable_tracks(track_names=None):
+    """Return all enabled tracks of the context timeline.
+
+    Args:
+        track_names (Optional[Iterable[str]]): export only tracks
+            with these names, all tracks are exported if not defined
+
+    Returns:
+        list[hiero.core.VideoTrack|hiero.core.AudioTrack]: tracks
+    """
+    if track_names is not None:
+        track_names = set(track_names)
+
+    return [
+        track for track in CTX.timeline.items()
+        # skip if track is disabled or filtered out
+        if track.isEnabled()
+        and (track_names is None or track.name() in track_names)
+    ]
+
+
+def export_otio_track(track, frame_range=None):
+    """Convert Hiero track with all its track items to otio track.
+
+    Context has to be prepared with `init_otio_timeline` first.
+
+    Track items outside of `frame_range` are replaced by gaps so
+    exported clips keep their position on the timeline.
+
+    Args:
+        track (hiero.core.VideoTrack|hiero.core.AudioTrack): track
+        frame_range (Optional[tuple[int, int]]): timeline in and out
+            frame, track items out of the range are not exported
+
+    Returns:
+        otio.schema.Track: converted track
+    """
+    # convert track to otio
+    otio_track = create_otio_track(
+        type(track), track.name())
+
+    prev_item = None
+    for track_item in track:
+        if frame_range:
+            if track_item.timelineOut() < frame_range[0]:
+                continue
+            # track items are ordered so rest is out of range too
+            if track_item.timelineIn() > frame_range[1]:
+                break
+
+        # add gap if first track item is not starting
+        # at first timeline frame
+        if prev_item is None:
+            if track_item.timelineIn() > 0:
+                add_otio_gap(track_item, otio_track, 0)
 
-            else:
-                # get previous item
-                prev_item = track_item.parent().items()[itemindex - 1]
+        # or add gap if following track items are having
+        # frame range differences from each other
+        elif track_item.timelineIn() - prev_item.timelineOut() != 1:
+            add_otio_gap(track_item, otio_track, prev_item.timelineOut())
 
-            # calculate clip frame range difference from each other
-            clip_diff = track_item.timelineIn() - prev_item.timelineOut()
+        # create otio clip and add it to track
+        otio_clip = create_otio_clip(track_item)
+        otio_track.append(otio_clip)
+        prev_item = track_item
 
-            # add gap if first track item is not starting
-            # at first timeline frame
-            if itemindex == 0 and track_item.timelineIn() > 0:
-                add_otio_gap(track_item, otio_track, 0)
+    # Add tags as markers
+    if CTX.include_tags:
+        create_otio_markers(otio_track, track)
 
-            # or add gap if following track items are having
-            # frame range differences from each other
-            elif itemindex and clip_diff != 1:
-                add_otio_gap(track_item, otio_track, prev_item.timelineOut())
+    return otio_track
 
-            # create otio clip and add it to track
-            otio_clip = create_otio_clip(track_item)
-            otio_track.append(otio_clip)
 
-        # Add tags as markers
-        if CTX.include_tags:
-            create_otio_markers(otio_track, track)
+def create_otio_timeline(
+    sequence: Optional[hiero.core.Sequence] = None,
+    tracks: Optional[Iterable[str]] = None,
+    frame_range: Optional[Tuple[int, int]] = None,
+    include_tags: bool = True,
+    source_markers_on_reference: bool = False,
+) -> otio.schema.Timeline:
+    """Convert Hiero sequence to otio timeline.
+
+    Args:
+        sequence (Optional[hiero.core.Sequence]): sequence to export,
+            active sequence is used if not defined
+        tracks (Optional[Iterable[str]]): names of tracks to export,
+            all enabled tracks are exported if not defined
+        frame_range (Optional[tuple[int, int]]): timeline in and out
+            frame, only track items within the range are exported
+        include_tags (bool): export tags of track items as markers
+        source_markers_on_reference (bool): export tags of source clips
+            as media reference metadata
+
+    Returns:
+        otio.schema.Timeline: converted timeline
+    """
+    # convert current timeline to otio
+    otio_timeline = init_otio_timeline(
+        sequence,
+        include_tags=include_tags,
+        source_markers_on_reference=source_markers_on_reference
+    )
 
+    # loop all defined track types
+    for track in get_exportable_tracks(tracks):
         # add track to otio timeline
-        otio_timeline.tracks.append(otio_track)
+        otio_timeline.tracks.append(export_otio_track(track, frame_range))
 
     return otio_timeline
 
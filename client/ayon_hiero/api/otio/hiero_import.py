@@ -6,6 +6,10 @@ __credits__ = ["Jakub Jezek", "Daniel Flehner Heen"]
 
 
 import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
 import hiero.core
 import hiero.ui
 
@@ -19,8 +23,15 @@ except ImportError:
 
 import opentimelineio as otio
 
+from .. import media_cache
+
 _otio_old = False
 
+# Maximum number of threads listing media directories before import
+MEDIA_PROBE_WORKERS = 8
+
+MediaProbe = namedtuple("MediaProbe", ("exists",))
+
 
 def inform(messages):
     if isinstance(messages, type('')):
@@ -34,8 +45,21 @@ def inform(messages):
     )
 
 
-def get_transition_type(otio_item, otio_track):
-    _in, _out = otio_track.neighbors_of(otio_item)
+def get_neighbors_at(otio_track, itemnum):
+    # Direct index access avoids searching the item in the track
+    _in = otio_track[itemnum - 1] if itemnum > 0 else None
+    _out = None
+    if itemnum + 1 < len(otio_track):
+        _out = otio_track[itemnum + 1]
+
+    return _in, _out
+
+
+def get_transition_type(otio_item, otio_track, neighbors=None):
+    if neighbors is None:
+        neighbors = otio_track.neighbors_of(otio_item)
+
+    _in, _out = neighbors
 
     if isinstance(_in, otio.schema.Gap):
         _in = None
@@ -79,24 +103,34 @@ def get_neighboring_trackitems(otio_item, otio_track, hiero_track):
     return trackitem_in, trackitem_out
 
 
-def apply_transition(otio_track, otio_item, track):
+def apply_transition(
+    otio_track, otio_item, track, trackitems=None, itemnum=None
+):
     warning = None
 
+    # Gather TrackItems involved in transition
+    if trackitems is None:
+        neighbors = otio_track.neighbors_of(otio_item)
+        item_in, item_out = get_neighboring_trackitems(
+            otio_item,
+            otio_track,
+            track
+        )
+
+    else:
+        # TrackItems recorded while building the track
+        neighbors = get_neighbors_at(otio_track, itemnum)
+        item_in = trackitems.get(itemnum - 1)
+        item_out = trackitems.get(itemnum + 1)
+
     # Figure out type of transition
-    transition_type = get_transition_type(otio_item, otio_track)
+    transition_type = get_transition_type(otio_item, otio_track, neighbors)
 
     # Figure out track kind for getattr below
     kind = ''
     if isinstance(track, hiero.core.AudioTrack):
         kind = 'Audio'
 
-    # Gather TrackItems involved in transition
-    item_in, item_out = get_neighboring_trackitems(
-        otio_item,
-        otio_track,
-        track
-    )
-
     # Create transition object
     if transition_type == 'dissolve':
         transition_func = getattr(
@@ -267,7 +301,32 @@ def add_metadata(metadata, hiero_item):
             hiero_item.metadata().setValue(key, str(value))
 
 
-def add_markers(otio_item, hiero_item, tagsbin):
+def index_tags(tagsbin, tags_index=None):
+    """Map all tags of tags bin and its sub-bins by their name.
+
+    First found tag is used for duplicated names same as with `get_tag`.
+
+    Args:
+        tagsbin (hiero.core.Bin): bin with tags
+        tags_index (Optional[dict[str, hiero.core.Tag]]): index to fill
+
+    Returns:
+        dict[str, hiero.core.Tag]: tags by name
+    """
+    if tags_index is None:
+        tags_index = {}
+
+    for tag in tagsbin.items():
+        if isinstance(tag, hiero.core.Bin):
+            index_tags(tag, tags_index)
+            continue
+
+        tags_index.setdefault(tag.name(), tag)
+
+    return tags_index
+
+
+def add_markers(otio_item, hiero_item, tags_index):
     if isinstance(otio_item, (otio.schema.Stack, otio.schema.Clip)):
         markers = otio_item.markers
 
@@ -277,6 +336,17 @@ def add_markers(otio_item, hiero_item, tagsbin):
     else:
         markers = []
 
+    if (
+        isinstance(otio_item, otio.schema.Clip)
+        and isinstance(hiero_item, hiero.core.Clip)
+        and otio_item.media_reference
+    ):
+        # source clip markers could be stored on media reference
+        source_markers = otio_item.media_reference.metadata.get(
+            'ayon.source.markers', []
+        )
+        markers = list(markers) + list(source_markers)
+
     for marker in markers:
         meta = marker.metadata.get('Hiero', dict())
         if 'source_type' in meta:
@@ -285,9 +355,9 @@ def add_markers(otio_item, hiero_item, tagsbin):
 
         marker_color = marker.color
 
-        _tag = get_tag(marker.name, tagsbin)
+        _tag = tags_index.get(marker.name)
         if _tag is None:
-            _tag = get_tag(marker_color_map[marker_color], tagsbin)
+            _tag = tags_index.get(marker_color_map[marker_color])
 
         if _tag is None:
             _tag = hiero.core.Tag(marker_color_map[marker.color])
@@ -329,40 +399,258 @@ def create_track(otio_track, tracknum, track_kind):
     return track
 
 
-def create_clip(otio_clip, tagsbin, sequencebin):
-    # Create MediaSource
-    url = None
-    media = None
+def get_media_path(url):
+    """Return local media path from prepared media url.
+
+    Args:
+        url (str): media url or path
+
+    Returns:
+        str: normalized local path
+    """
+    path = unquote(url)
+    if path.startswith('file://localhost'):
+        path = path[len('file://localhost'):]
+
+    # Windows drive letter behind leading separator
+    if re.match(r'^[\\/][a-zA-Z]:', path):
+        path = path[1:]
+
+    return os.path.normpath(path)
+
+
+def get_media_key(url):
+    """Return normalized media path usable as dictionary key.
+
+    Args:
+        url (str): media url or path
+
+    Returns:
+        str: normalized path
+    """
+    return os.path.normcase(get_media_path(url))
+
+
+def get_media_url(otio_clip):
+    """Return prepared media url of otio clip.
+
+    Args:
+        otio_clip (otio.schema.Clip): otio clip
+
+    Returns:
+        Optional[str]: url or None if clip has no file media
+    """
     otio_media = otio_clip.media_reference
 
     if isinstance(otio_media, otio.schema.ExternalReference):
-        url = prep_url(otio_media.target_url)
-        media = hiero.core.MediaSource(url)
+        return prep_url(otio_media.target_url)
 
     elif not _otio_old:
         if isinstance(otio_media, otio.schema.ImageSequenceReference):
-            url = prep_url(otio_media.abstract_target_url('#'))
-            media = hiero.core.MediaSource(url)
+            return prep_url(otio_media.abstract_target_url('#'))
+
+    return None
+
+
+def _get_frame_pattern(basename):
+    # Frame number in file name as '#' padding or printf '%04d' style
+    parts = re.split(r'(#+|%0?\d*d)', basename)
+    if len(parts) == 1:
+        return None
+
+    return re.compile('^{}$'.format(''.join(
+        r'\d+' if index % 2 else re.escape(part)
+        for index, part in enumerate(parts)
+    )))
+
+
+def _get_mtime(dirpath):
+    try:
+        return os.stat(dirpath).st_mtime
+
+    except OSError:
+        return None
+
+
+def _list_directory(dirpath):
+    try:
+        return set(os.listdir(dirpath))
+
+    except OSError:
+        return None
+
+
+def _probe_media_path(path, filenames):
+    if filenames is None:
+        return MediaProbe(False)
+
+    basename = os.path.basename(path)
+    frame_pattern = _get_frame_pattern(basename)
+    if frame_pattern is None:
+        return MediaProbe(basename in filenames)
+
+    # sequence exists if any of its frames exists
+    return MediaProbe(any(
+        frame_pattern.match(filename) for filename in filenames
+    ))
+
+
+def probe_media(otio_timeline, max_workers=None):
+    """Check existence of all media used by timeline.
+
+    Every media directory is listed only once and listing runs in
+    a bounded thread pool, so offline media do not need to be probed
+    with `hiero.core.MediaSource` one by one. Results are kept in
+    persistent media cache until the directory is modified.
+
+    Args:
+        otio_timeline (otio.schema.Timeline|otio.schema.Track): timeline
+        max_workers (Optional[int]): number of threads listing directories
+
+    Returns:
+        dict[str, MediaProbe]: probes by media key
+    """
+    try:  # opentimelineio >= 0.16.0
+        all_clips = otio_timeline.find_clips()
+    except AttributeError:  # legacy
+        all_clips = otio_timeline.each_clip()
+
+    paths_by_key = {}
+    for otio_clip in all_clips:
+        url = get_media_url(otio_clip)
+        if url:
+            paths_by_key[get_media_key(url)] = get_media_path(url)
+
+    dirpaths = list({os.path.dirname(path) for path in paths_by_key.values()})
+    if not dirpaths:
+        return {}
+
+    max_workers = min(max_workers or MEDIA_PROBE_WORKERS, len(dirpaths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dir_mtimes = dict(zip(dirpaths, executor.map(_get_mtime, dirpaths)))
+
+    # Use results cached in previous sessions for unchanged directories
+    probes = {}
+    path_mtimes = []
+    for media_key, path in paths_by_key.items():
+        dir_mtime = dir_mtimes[os.path.dirname(path)]
+        if dir_mtime is None:
+            probes[media_key] = MediaProbe(False)
+            continue
+        path_mtimes.append((path, dir_mtime))
+
+    cache = media_cache.get_media_cache()
+    cached_by_path = {}
+    if cache is not None:
+        cached_by_path = cache.get_many("directory_listing", path_mtimes)
+
+    uncached_paths = {}
+    for media_key, path in paths_by_key.items():
+        if media_key in probes:
+            continue
+
+        cached = cached_by_path.get(path)
+        if cached is None:
+            uncached_paths[media_key] = path
+        else:
+            probes[media_key] = MediaProbe(cached["exists"])
+
+    dirpaths = list({
+        os.path.dirname(path) for path in uncached_paths.values()})
+    if not dirpaths:
+        return probes
+
+    max_workers = min(max_workers, len(dirpaths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listings = dict(zip(dirpaths, executor.map(_list_directory, dirpaths)))
 
-    if media is None or media.isOffline():
-        media = create_offline_mediasource(otio_clip, url)
+    cache_items = []
+    for media_key, path in uncached_paths.items():
+        dirpath = os.path.dirname(path)
+        probe = _probe_media_path(path, listings[dirpath])
+        probes[media_key] = probe
+        cache_items.append((path, probe._asdict(), dir_mtimes[dirpath]))
+
+    if cache is not None:
+        cache.set_many("directory_listing", cache_items)
+
+    return probes
+
+
+def index_bin_clips(binitem):
+    """Map clips already present in bin by their media path.
+
+    Args:
+        binitem (hiero.core.Bin): bin with clips
+
+    Returns:
+        dict[str, hiero.core.Clip]: clips by normalized media path
+    """
+    clips_index = {}
+    for item in binitem.clips():
+        clip = item.activeItem()
+        file_infos = clip.mediaSource().fileinfos()
+        if not file_infos:
+            continue
+
+        media_key = get_media_key(file_infos[0].filename())
+        clips_index.setdefault(media_key, clip)
+
+    return clips_index
+
+
+def create_clip(
+    otio_clip, tags_index, sequencebin, clips_index=None, media_probes=None
+):
+    """Create clip or reuse clip with the same media.
+
+    Args:
+        otio_clip (otio.schema.Clip): otio clip
+        tags_index (dict[str, hiero.core.Tag]): tag presets by name
+        sequencebin (hiero.core.Bin): bin to which new clips are added
+        clips_index (Optional[dict[str, hiero.core.Clip]]): clips by
+            normalized media path shared across one import, indexed
+            from `sequencebin` if not passed
+        media_probes (Optional[dict[str, MediaProbe]]): result of
+            `probe_media`, offline media are not probed by Hiero again
+
+    Returns:
+        hiero.core.Clip: clip with media of otio clip
+    """
+    if clips_index is None:
+        clips_index = index_bin_clips(sequencebin)
+
+    # Resolve media url
+    url = get_media_url(otio_clip)
 
     # Reuse previous clip if possible
-    clip = None
-    for item in sequencebin.clips():
-        if item.activeItem().mediaSource() == media:
-            clip = item.activeItem()
-            break
+    media_key = get_media_key(url) if url else None
+    clip = clips_index.get(media_key) if media_key else None
 
     if not clip:
+        probe = None
+        if media_probes and media_key:
+            probe = media_probes.get(media_key)
+
+        # Create MediaSource
+        media = None
+        if url and (probe is None or probe.exists):
+            media = hiero.core.MediaSource(url)
+
+        if media is None or media.isOffline():
+            media = create_offline_mediasource(otio_clip, url)
+
         # Create new Clip
         clip = hiero.core.Clip(media)
 
         # Add Clip to a Bin
         sequencebin.addItem(hiero.core.BinItem(clip))
 
+        if media_key:
+            clips_index[media_key] = clip
+
     # Add markers
-    add_markers(otio_clip, clip, tagsbin)
+    add_markers(otio_clip, clip, tags_index)
 
     return clip
 
@@ -427,7 +715,13 @@ def create_trackitem(playhead, track, otio_clip, clip):
 
 
 def build_sequence(
-    otio_timeline, project=None, sequence=None, track_kind=None
+    otio_timeline,
+    project=None,
+    sequence=None,
+    track_kind=None,
+    clips_index=None,
+    tags_index=None,
+    media_probes=None,
 ):
     if project is None:
         if sequence:
@@ -461,11 +755,21 @@ def build_sequence(
     else:
         sequencebin = projectbin
 
-    # Get tagsBin
-    tagsbin = hiero.core.project("Tag Presets").tagsBin()
+    # Clips are reused by media path during whole import
+    if clips_index is None:
+        clips_index = index_bin_clips(sequencebin)
+
+    # Get tags of tagsBin by name only once per import
+    if tags_index is None:
+        tagsbin = hiero.core.project("Tag Presets").tagsBin()
+        tags_index = index_tags(tagsbin)
+
+    # Check all media of the timeline at once before clips are created
+    if media_probes is None:
+        media_probes = probe_media(otio_timeline)
 
     # Add timeline markers
-    add_markers(otio_timeline, sequence, tagsbin)
+    add_markers(otio_timeline, sequence, tags_index)
 
     if isinstance(otio_timeline, otio.schema.Timeline):
         tracks = otio_timeline.tracks
@@ -476,13 +780,15 @@ def build_sequence(
     for tracknum, otio_track in enumerate(tracks):
         playhead = 0
         _transitions = []
+        # TrackItems by index of their otio clip in track
+        trackitems = {}
 
         # Add track to sequence
         track = create_track(otio_track, tracknum, track_kind)
         sequence.addTrack(track)
 
         # iterate over items in track
-        for _itemnum, otio_clip in enumerate(otio_track):
+        for itemnum, otio_clip in enumerate(otio_track):
             if isinstance(otio_clip, (otio.schema.Track, otio.schema.Stack)):
                 inform('Nested sequences/tracks are created separately.')
 
@@ -493,12 +799,21 @@ def build_sequence(
                 build_sequence(
                     otio_clip,
                     project=project,
-                    track_kind=otio_track.kind
+                    track_kind=otio_track.kind,
+                    clips_index=clips_index,
+                    tags_index=tags_index,
+                    media_probes=media_probes,
                 )
 
             elif isinstance(otio_clip, otio.schema.Clip):
                 # Create a Clip
-                clip = create_clip(otio_clip, tagsbin, sequencebin)
+                clip = create_clip(
+                    otio_clip,
+                    tags_index,
+                    sequencebin,
+                    clips_index,
+                    media_probes,
+                )
 
                 # Create TrackItem
                 trackitem = create_trackitem(
@@ -506,17 +821,18 @@ def build_sequence(
                 )
 
                 # Add markers
-                add_markers(otio_clip, trackitem, tagsbin)
+                add_markers(otio_clip, trackitem, tags_index)
 
                 # Add trackitem to track
                 track.addTrackItem(trackitem)
+                trackitems[itemnum] = trackitem
 
                 # Update playhead
                 playhead = trackitem.timelineOut() + 1
 
             elif isinstance(otio_clip, otio.schema.Transition):
                 # Store transitions for when all clips in the track are created
-                _transitions.append((otio_track, otio_clip))
+                _transitions.append((otio_track, otio_clip, itemnum))
 
             elif isinstance(otio_clip, otio.schema.Gap):
                 # Hiero has no fillers, slugs or blanks at the moment
@@ -524,10 +840,11 @@ def build_sequence(
 
         # Apply transitions we stored earlier now that all clips are present
         warnings = []
-        for otio_track, otio_item in _transitions:
+        for otio_track, otio_item, itemnum in _transitions:
             # Catch warnings form transitions in case
             # of unsupported transitions
-            warning = apply_transition(otio_track, otio_item, track)
+            warning = apply_transition(
+                otio_track, otio_item, track, trackitems, itemnum)
             if warning:
                 warnings.append(warning)
 
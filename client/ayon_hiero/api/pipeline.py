@@ -20,6 +20,7 @@ from ayon_core.pipeline import (
     schema,
     register_creator_plugin_path,
     register_loader_plugin_path,
+    register_inventory_action_path,
     AVALON_CONTAINER_ID,
     AYON_CONTAINER_ID,
 )
@@ -44,6 +45,7 @@ PLUGINS_DIR = os.path.join(HIERO_ADDON_ROOT, "plugins")
 PUBLISH_PATH = os.path.join(PLUGINS_DIR, "publish").replace("\\", "/")
 LOAD_PATH = os.path.join(PLUGINS_DIR, "load").replace("\\", "/")
 CREATE_PATH = os.path.join(PLUGINS_DIR, "create").replace("\\", "/")
+INVENTORY_PATH = os.path.join(PLUGINS_DIR, "inventory").replace("\\", "/")
 
 AVALON_CONTAINERS = ":AVALON_CONTAINERS"
 
@@ -83,6 +85,7 @@ class HieroHost(
         pyblish.register_plugin_path(PUBLISH_PATH)
         register_loader_plugin_path(LOAD_PATH)
         register_creator_plugin_path(CREATE_PATH)
+        register_inventory_action_path(INVENTORY_PATH)
 
         # install menu
         menu.menu_install()
@@ -17,7 +17,7 @@ from ayon_core.pipeline import (
 )
 from ayon_core.pipeline.load import get_representation_path_from_context
 
-from . import lib
+from . import lib, media_cache
 
 
 log = Logger.get_logger(__name__)
@@ -526,9 +526,21 @@ class ClipLoader:
         self.active_bin = lib.create_bin(self.data["binPath"])
 
         # create mediaItem in active project bin
-        # create clip media
-        self.media = hiero.core.MediaSource(self.data["path"])
-        self.media_duration = int(self.media.duration())
+        clip_in_bin = self.data["clip_name"] in [
+            b.name() for b in self.active_bin.items()]
+
+        # media of clip which is already in bin are not probed again
+        # if their information is cached
+        media_info = None
+        if clip_in_bin:
+            media_info = media_cache.get_cached_media_info(self.data["path"])
+
+        if media_info is None:
+            # create clip media
+            self.media = hiero.core.MediaSource(self.data["path"])
+            media_info = media_cache.cache_media_source(
+                self.data["path"], self.media)
+        self.media_duration = media_info["duration"]
 
         # get handles
         version_attributes = self.data["versionAttributes"]
@@ -572,13 +584,12 @@ class ClipLoader:
             self.media_duration -= 1
             self.handle_start += 1
 
-        # create Clip from Media
-        clip = hiero.core.Clip(self.media)
-        clip.setName(self.data["clip_name"])
-
         # add Clip to bin if not there yet
-        if self.data["clip_name"] not in [
-                b.name() for b in self.active_bin.items()]:
+        if not clip_in_bin:
+            # create Clip from Media
+            clip = hiero.core.Clip(self.media)
+            clip.setName(self.data["clip_name"])
+
             bin_item = hiero.core.BinItem(clip)
             self.active_bin.addItem(bin_item)
 
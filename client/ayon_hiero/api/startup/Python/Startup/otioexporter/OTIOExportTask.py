@@ -16,17 +16,53 @@ class OTIOExportTask(hiero.core.TaskBase):
         """Initialize"""
         hiero.core.TaskBase.__init__(self, initDict)
         self.otio_timeline = None
+        self._tracks = []
+        self._track_index = 0
+        self._export_context = None
+        self._aborted = False
 
     def name(self):
         return str(type(self))
 
     def startTask(self):
-        self.otio_timeline = hiero_export.create_otio_timeline()
+        properties = self._preset.properties()
+
+        # only prepare timeline, tracks are converted in `taskStep`
+        self.otio_timeline = hiero_export.init_otio_timeline(
+            getattr(self, "_sequence", None),
+            include_tags=properties["includeTags"],
+            source_markers_on_reference=properties.get(
+                "sourceMarkersOnReference", False)
+        )
+        self._tracks = hiero_export.get_exportable_tracks()
+        self._track_index = 0
+        # other exports may change shared context between steps
+        self._export_context = hiero_export.get_export_context()
 
     def taskStep(self):
-        return False
+        if self._aborted or self._track_index >= len(self._tracks):
+            return False
+
+        # convert one track per step so export queue stays responsive
+        track = self._tracks[self._track_index]
+        hiero_export.set_export_context(self._export_context)
+        self.otio_timeline.tracks.append(
+            hiero_export.export_otio_track(track))
+        self._track_index += 1
+
+        return self._track_index < len(self._tracks)
+
+    def progress(self):
+        if not self._tracks:
+            return 1.0 if self.otio_timeline is not None else 0.0
+
+        return float(self._track_index) / len(self._tracks)
 
     def finishTask(self):
+        if self._aborted:
+            hiero.core.TaskBase.finishTask(self)
+            return
+
         try:
             exportPath = self.resolvedExportPath()
 
@@ -51,7 +87,7 @@ class OTIOExportTask(hiero.core.TaskBase):
         hiero.core.TaskBase.finishTask(self)
 
     def forcedAbort(self):
-        pass
+        self._aborted = True
 
 
 class OTIOExportPreset(hiero.core.TaskPresetBase):
@@ -60,6 +96,7 @@ class OTIOExportPreset(hiero.core.TaskPresetBase):
         hiero.core.TaskPresetBase.__init__(self, OTIOExportTask, name)
 
         self.properties()["includeTags"] = hiero_export.include_tags = True
+        self.properties()["sourceMarkersOnReference"] = False
         self.properties().update(properties)
 
     def supportedItems(self):
@@ -35,6 +35,13 @@ class OTIOExportUI(hiero.ui.TaskUIBase):
     def includeMarkersCheckboxChanged(self, state):
         # Slot to handle change of checkbox state
         hiero_export.include_tags = state == QtCore.Qt.Checked
+        self._preset.properties()["includeTags"] = (
+            state == QtCore.Qt.Checked)
+
+    def sourceMarkersCheckboxChanged(self, state):
+        # Slot to handle change of checkbox state
+        self._preset.properties()["sourceMarkersOnReference"] = (
+            state == QtCore.Qt.Checked)
 
     def populateUI(self, widget, exportTemplate):
         layout = widget.layout()
@@ -65,6 +72,24 @@ class OTIOExportUI(hiero.ui.TaskUIBase):
         # Add Checkbox to layout
         formLayout.addRow("Include Tags:", self.includeMarkersCheckbox)
 
+        # Checkbox for storing source clip tags on media reference
+        self.sourceMarkersCheckbox = QCheckBox()
+        self.sourceMarkersCheckbox.setToolTip(
+            "Enable to store source clip Tags on the media reference "
+            "instead of adding them to every clip using the source."
+        )
+        self.sourceMarkersCheckbox.setCheckState(QtCore.Qt.Unchecked)
+
+        if self._preset.properties().get("sourceMarkersOnReference"):
+            self.sourceMarkersCheckbox.setCheckState(QtCore.Qt.Checked)
+
+        self.sourceMarkersCheckbox.stateChanged.connect(
+            self.sourceMarkersCheckboxChanged
+        )
+
+        formLayout.addRow(
+            "Source Tags on Media:", self.sourceMarkersCheckbox)
+
 
 hiero.ui.taskUIRegistry.registerTaskUI(
     OTIOExportPreset,
@@ -34,8 +34,21 @@ except ImportError:
 import opentimelineio as otio
 
 
-def get_transition_type(otio_item, otio_track):
-    _in, _out = otio_track.neighbors_of(otio_item)
+def get_neighbors_at(otio_track, itemnum):
+    # Direct index access avoids searching the item in the track
+    _in = otio_track[itemnum - 1] if itemnum > 0 else None
+    _out = None
+    if itemnum + 1 < len(otio_track):
+        _out = otio_track[itemnum + 1]
+
+    return _in, _out
+
+
+def get_transition_type(otio_item, otio_track, neighbors=None):
+    if neighbors is None:
+        neighbors = otio_track.neighbors_of(otio_item)
+
+    _in, _out = neighbors
 
     if isinstance(_in, otio.schema.Gap):
         _in = None
@@ -78,10 +91,9 @@ def get_neighboring_trackitems(otio_item, otio_track, hiero_track):
     return trackitem_in, trackitem_out
 
 
-def apply_transition(otio_track, otio_item, track):
-    # Figure out type of transition
-    transition_type = get_transition_type(otio_item, otio_track)
-
+def apply_transition(
+    otio_track, otio_item, track, trackitems=None, itemnum=None
+):
     # Figure out track kind for getattr below
     if isinstance(track, hiero.core.VideoTrack):
         kind = ""
@@ -91,11 +103,23 @@ def apply_transition(otio_track, otio_item, track):
 
     try:
         # Gather TrackItems involved in transition
-        item_in, item_out = get_neighboring_trackitems(
-            otio_item,
-            otio_track,
-            track
-        )
+        if trackitems is None:
+            neighbors = otio_track.neighbors_of(otio_item)
+            item_in, item_out = get_neighboring_trackitems(
+                otio_item,
+                otio_track,
+                track
+            )
+
+        else:
+            # TrackItems recorded while building the track
+            neighbors = get_neighbors_at(otio_track, itemnum)
+            item_in = trackitems.get(itemnum - 1)
+            item_out = trackitems.get(itemnum + 1)
+
+        # Figure out type of transition
+        transition_type = get_transition_type(
+            otio_item, otio_track, neighbors)
 
         # Create transition object
         if transition_type == "dissolve":
@@ -223,7 +247,22 @@ def add_metadata(metadata, hiero_item):
             hiero_item.metadata().setValue(key, str(value))
 
 
-def add_markers(otio_item, hiero_item, tagsbin):
+def index_tags(tagsbin, tags_index=None):
+    # Map tags of bin and its sub-bins by name, first found tag wins
+    if tags_index is None:
+        tags_index = {}
+
+    for tag in tagsbin.items():
+        if isinstance(tag, hiero.core.Bin):
+            index_tags(tag, tags_index)
+            continue
+
+        tags_index.setdefault(tag.name(), tag)
+
+    return tags_index
+
+
+def add_markers(otio_item, hiero_item, tags_index):
     if isinstance(otio_item, (otio.schema.Stack, otio.schema.Clip)):
         markers = otio_item.markers
 
@@ -236,9 +275,9 @@ def add_markers(otio_item, hiero_item, tagsbin):
     for marker in markers:
         marker_color = marker.color
 
-        _tag = get_tag(marker.name, tagsbin)
+        _tag = tags_index.get(marker.name)
         if _tag is None:
-            _tag = get_tag(marker_color_map[marker_color], tagsbin)
+            _tag = tags_index.get(marker_color_map[marker_color])
 
         if _tag is None:
             _tag = hiero.core.Tag(marker_color_map[marker.color])
@@ -269,10 +308,26 @@ def create_track(otio_track, tracknum, track_kind):
     return track
 
 
-def create_clip(otio_clip):
-    # Create MediaSource
+def get_media_key(url):
+    path = unquote(url)
+    if path.startswith("file://localhost"):
+        path = path[len("file://localhost"):]
+
+    return os.path.normcase(os.path.normpath(path))
+
+
+def create_clip(otio_clip, sequencebin, clips_index):
+    # Reuse clip created earlier in this import for the same media
     otio_media = otio_clip.media_reference
+    media_key = None
     if isinstance(otio_media, otio.schema.ExternalReference):
+        media_key = get_media_key(otio_media.target_url)
+        clip = clips_index.get(media_key)
+        if clip is not None:
+            return clip
+
+    # Create MediaSource
+    if media_key:
         url = prep_url(otio_media.target_url)
         media = hiero.core.MediaSource(url)
         if media.isOffline():
@@ -284,10 +339,16 @@ def create_clip(otio_clip):
     # Create Clip
     clip = hiero.core.Clip(media)
 
+    # Add Clip to a Bin
+    sequencebin.addItem(hiero.core.BinItem(clip))
+
+    if media_key:
+        clips_index[media_key] = clip
+
     return clip
 
 
-def create_trackitem(playhead, track, otio_clip, clip, tagsbin):
+def create_trackitem(playhead, track, otio_clip, clip, tags_index):
     source_range = otio_clip.source_range
 
     trackitem = track.createTrackItem(otio_clip.name)
@@ -325,13 +386,18 @@ def create_trackitem(playhead, track, otio_clip, clip, tagsbin):
     trackitem.setTimelineOut(timeline_out)
 
     # Add markers
-    add_markers(otio_clip, trackitem, tagsbin)
+    add_markers(otio_clip, trackitem, tags_index)
 
     return trackitem
 
 
 def build_sequence(
-    otio_timeline, project=None, sequence=None, track_kind=None
+    otio_timeline,
+    project=None,
+    sequence=None,
+    track_kind=None,
+    clips_index=None,
+    tags_index=None,
 ):
 
     if project is None:
@@ -364,11 +430,17 @@ def build_sequence(
     else:
         sequencebin = projectbin
 
-    # Get tagsBin
-    tagsbin = hiero.core.project("Tag Presets").tagsBin()
+    # Clips are reused by media path during whole import
+    if clips_index is None:
+        clips_index = {}
+
+    # Get tags of tagsBin by name only once per import
+    if tags_index is None:
+        tagsbin = hiero.core.project("Tag Presets").tagsBin()
+        tags_index = index_tags(tagsbin)
 
     # Add timeline markers
-    add_markers(otio_timeline, sequence, tagsbin)
+    add_markers(otio_timeline, sequence, tags_index)
 
     if isinstance(otio_timeline, otio.schema.Timeline):
         tracks = otio_timeline.tracks
@@ -379,6 +451,8 @@ def build_sequence(
     for tracknum, otio_track in enumerate(tracks):
         playhead = 0
         _transitions = []
+        # TrackItems by index of their otio clip in track
+        trackitems = {}
 
         # Add track to sequence
         track = create_track(otio_track, tracknum, track_kind)
@@ -391,34 +465,39 @@ def build_sequence(
                 bar.showMessage(
                     "Nested sequences are created separately.", timeout=3000
                 )
-                build_sequence(otio_clip, project, otio_track.kind)
+                build_sequence(
+                    otio_clip,
+                    project,
+                    track_kind=otio_track.kind,
+                    clips_index=clips_index,
+                    tags_index=tags_index,
+                )
 
             elif isinstance(otio_clip, otio.schema.Clip):
                 # Create a Clip
-                clip = create_clip(otio_clip)
-
-                # Add Clip to a Bin
-                sequencebin.addItem(hiero.core.BinItem(clip))
+                clip = create_clip(otio_clip, sequencebin, clips_index)
 
                 # Create TrackItem
                 trackitem = create_trackitem(
-                    playhead, track, otio_clip, clip, tagsbin
+                    playhead, track, otio_clip, clip, tags_index
                 )
 
                 # Add trackitem to track
                 track.addTrackItem(trackitem)
+                trackitems[itemnum] = trackitem
 
                 # Update playhead
                 playhead = trackitem.timelineOut() + 1
 
             elif isinstance(otio_clip, otio.schema.Transition):
                 # Store transitions for when all clips in the track are created
-                _transitions.append((otio_track, otio_clip))
+                _transitions.append((otio_track, otio_clip, itemnum))
 
             elif isinstance(otio_clip, otio.schema.Gap):
                 # Hiero has no fillers, slugs or blanks at the moment
                 playhead += otio_clip.source_range.duration.value
 
         # Apply transitions we stored earlier now that all clips are present
-        for otio_track, otio_item in _transitions:
-            apply_transition(otio_track, otio_item, track)
+        for otio_track, otio_item, itemnum in _transitions:
+            apply_transition(
+                otio_track, otio_item, track, trackitems, itemnum)
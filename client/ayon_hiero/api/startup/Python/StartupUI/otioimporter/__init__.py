@@ -4,12 +4,18 @@
 __author__ = "Daniel Flehner Heen"
 __credits__ = ["Jakub Jezek", "Daniel Flehner Heen"]
 
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+
 import hiero.ui
 import hiero.core
 
+from qtpy import QtCore
 from qtpy import QtWidgets as qw
 
-from ayon_hiero.api.otio.hiero_import import load_otio
+import opentimelineio as otio
+
+from ayon_hiero.api.otio.hiero_import import build_sequence, inform
 
 
 class OTIOProjectSelect(qw.QDialog):
@@ -125,8 +131,71 @@ def open_otio_file():
     else:
         project = hiero.core.projects()[-1]
 
-    for otio_file in files:
-        load_otio(otio_file, project, sequence)
+    load_otio_files(files, project, sequence)
+
+
+def load_otio_files(otio_files, project, sequence=None):
+    """Parse OTIO files in parallel and build them one after another.
+
+    Parsing does not need Hiero so all files are read in a thread pool
+    while previously parsed timelines are built on the UI thread.
+    Parse errors are reported together after all files are processed.
+    """
+    if not otio_files:
+        return
+
+    errors = []
+    progress = qw.QProgressDialog(
+        "Importing OTIO files...",
+        "Cancel",
+        0,
+        len(otio_files),
+        hiero.ui.mainWindow()
+    )
+    progress.setWindowTitle("OTIO Import")
+    progress.setWindowModality(QtCore.Qt.WindowModal)
+    progress.setMinimumDuration(0)
+
+    max_workers = min(len(otio_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(otio.adapters.read_from_file, otio_file)
+            for otio_file in otio_files
+        ]
+        for index, otio_file in enumerate(otio_files):
+            future = futures[index]
+            if progress.wasCanceled():
+                for pending in futures[index:]:
+                    pending.cancel()
+                break
+
+            progress.setLabelText(
+                "Importing {name} ({num}/{count})".format(
+                    name=os.path.basename(otio_file),
+                    num=index + 1,
+                    count=len(otio_files)
+                )
+            )
+            progress.setValue(index)
+
+            # Keep UI responsive while the file is still parsed
+            while not future.done():
+                qw.QApplication.processEvents()
+                wait([future], timeout=0.05)
+
+            try:
+                otio_timeline = future.result()
+
+            except Exception as e:
+                errors.append("{f}: {e}".format(f=otio_file, e=e))
+                continue
+
+            build_sequence(otio_timeline, project=project, sequence=sequence)
+
+    progress.setValue(len(otio_files))
+
+    if errors:
+        inform(["Unable to parse OTIO files:"] + errors)
 
 
 # HieroPlayer is quite limited and can't create transitions etc.
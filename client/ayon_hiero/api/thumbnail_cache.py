@@ -0,0 +1,219 @@
+"""Persistent cache of rendered track item thumbnails.
+
+Rendering thumbnail through `hiero.core.TrackItem.thumbnail` is slow and
+the same media frames are rendered again on every publish. Rendered
+images are stored in AYON local directory under content key made of
+media path, modification time and size of media file (frame file of
+image sequences), source frame, colour transform and thumbnail layer. Least recently used images are evicted once size
+of the cache exceeds its limit.
+"""
+import os
+import uuid
+import shutil
+import hashlib
+import threading
+
+from ayon_core.lib import Logger
+
+try:
+    from ayon_core.lib import get_launcher_local_dir
+except ImportError:
+    # older ayon-core
+    from ayon_core.lib import get_ayon_appdirs as get_launcher_local_dir
+
+
+log = Logger.get_logger(__name__)
+
+CACHE_DIRNAME = "hiero_thumbnails"
+# Maximum size of cached thumbnails in bytes
+MAX_SIZE = 512 * 1024 * 1024
+# Eviction shrinks cache to this fraction of maximum size so a full cache
+#   is not scanned again on each following add
+EVICTION_TARGET_RATIO = 0.9
+
+
+class _CTX:
+    cache = None
+
+
+class ThumbnailCache:
+    """Size bounded LRU cache of thumbnail images on disk.
+
+    Args:
+        root (str): directory where thumbnails are stored
+        max_size (Optional[int]): maximum size of cache in bytes
+    """
+
+    def __init__(self, root, max_size=None):
+        self._root = root
+        self._max_size = max_size or MAX_SIZE
+        self._lock = threading.Lock()
+        # size of cached images, scanned on first add and then tracked
+        #   incrementally so the directory is listed only when it's full
+        self._total_size = None
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def get_key(media_path, frame, colour_transform, layer, media_file=None):
+        """Content key of thumbnail.
+
+        Modification time and size of media file are part of the key so
+        media overwritten in place do not reuse outdated thumbnails.
+
+        Args:
+            media_path (str): path of track item media
+            frame (int): source frame of thumbnail
+            colour_transform (str): colour transform of media
+            layer (str): thumbnail layer
+            media_file (Optional[str]): file with thumbnail frame, frame
+                file of image sequence, `media_path` is used if not set
+
+        Returns:
+            str: key of thumbnail
+        """
+        try:
+            stat = os.stat(media_file or media_path)
+            media_stat = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            media_stat = None
+
+        key_data = "|".join(str(value) for value in (
+            media_path.replace("\\", "/"),
+            media_stat,
+            int(frame),
+            colour_transform,
+            layer,
+        ))
+        return hashlib.sha1(key_data.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key, ext):
+        return os.path.join(self._root, "{}.{}".format(key, ext))
+
+    def get(self, key, ext="png"):
+        """Get path to cached thumbnail.
+
+        Args:
+            key (str): key of thumbnail
+            ext (str): extension of thumbnail image
+
+        Returns:
+            Optional[str]: path to cached image or None
+        """
+        path = self._get_path(key, ext)
+        try:
+            # mark as recently used
+            os.utime(path, None)
+        except OSError:
+            return None
+        return path
+
+    def add(self, key, src_path, ext="png"):
+        """Store thumbnail image to cache.
+
+        Args:
+            key (str): key of thumbnail
+            src_path (str): path of rendered thumbnail
+            ext (str): extension of thumbnail image
+
+        Returns:
+            str: path to cached image
+        """
+        path = self._get_path(key, ext)
+        tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+        shutil.copyfile(src_path, tmp_path)
+        size = os.path.getsize(tmp_path)
+
+        with self._lock:
+            try:
+                replaced_size = os.path.getsize(path)
+            except OSError:
+                replaced_size = 0
+            os.replace(tmp_path, path)
+
+            if self._total_size is None:
+                self._total_size = self._get_entries()[1]
+            else:
+                self._total_size += size - replaced_size
+
+            if self._total_size > self._max_size:
+                self._evict()
+        return path
+
+    def _get_entries(self):
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self._root):
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            total_size += stat.st_size
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries, total_size
+
+    def _evict(self):
+        # rescan as other processes may share the cache directory
+        entries, total_size = self._get_entries()
+        self._total_size = total_size
+        if total_size <= self._max_size:
+            return
+
+        target_size = self._max_size * EVICTION_TARGET_RATIO
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if total_size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            removed += 1
+        self._total_size = total_size
+        log.debug("Evicted {} cached thumbnails".format(removed))
+
+    def clear(self):
+        """Remove all cached thumbnails."""
+        with self._lock:
+            shutil.rmtree(self._root, ignore_errors=True)
+            os.makedirs(self._root, exist_ok=True)
+            self._total_size = 0
+
+
+def get_thumbnail_cache(max_size=None):
+    """Get shared thumbnail cache.
+
+    Args:
+        max_size (Optional[int]): maximum size of cache in bytes
+
+    Returns:
+        Optional[ThumbnailCache]: cache or None if it can't be used
+    """
+    if _CTX.cache is None:
+        root = os.path.join(get_launcher_local_dir(), CACHE_DIRNAME)
+        try:
+            _CTX.cache = ThumbnailCache(root, max_size)
+        except OSError:
+            log.warning(
+                "Thumbnail cache '{}' can't be used".format(root),
+                exc_info=True
+            )
+            # do not try again in this session
+            _CTX.cache = False
+
+    return _CTX.cache or None
+
+
+def link_or_copy(src_path, dst_path):
+    """Hard link cached image to destination, copy if link fails.
+
+    Args:
+        src_path (str): cached image path
+        dst_path (str): destination path
+    """
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+    try:
+        os.link(src_path, dst_path)
+    except OSError:
+        shutil.copyfile(src_path, dst_path)
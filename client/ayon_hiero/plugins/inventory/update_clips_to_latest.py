@@ -0,0 +1,139 @@
+from collections import defaultdict
+
+import ayon_api
+
+from ayon_core.pipeline import (
+    InventoryAction,
+    get_current_project_name,
+    discover_loader_plugins,
+)
+from ayon_core.pipeline.load import get_representation_contexts
+
+
+class UpdateClipsToLatest(InventoryAction):
+    """Update all selected clips to their latest versions at once.
+
+    Updating containers one by one in the scene inventory resolves
+    every representation and last version separately. This action
+    resolves all of them with few queries and passes them to
+    `LoadClip.update_many`.
+    """
+
+    label = "Update Clips to Latest"
+    icon = "angle-double-up"
+    color = "#d8d8d8"
+    order = -1
+
+    loader_name = "LoadClip"
+
+    @classmethod
+    def is_compatible(cls, container):
+        return container.get("loader") == cls.loader_name
+
+    def process(self, containers):
+        loader = next(
+            (
+                loader_cls
+                for loader_cls in discover_loader_plugins()
+                if loader_cls.__name__ == self.loader_name
+            ),
+            None
+        )
+        if loader is None:
+            self.log.warning(
+                "Loader `{}` is not available".format(self.loader_name))
+            return
+
+        project_name = get_current_project_name()
+        containers_contexts = self.get_latest_contexts(
+            project_name, containers)
+        if not containers_contexts:
+            self.log.info("All clips are already at their latest versions")
+            return
+
+        loader().update_many(containers_contexts)
+        return True
+
+    @staticmethod
+    def get_latest_contexts(project_name, containers):
+        """Get latest representation contexts of outdated containers.
+
+        Args:
+            project_name (str): project name
+            containers (list[dict]): containers to update
+
+        Returns:
+            list[tuple[dict, dict]]: containers with contexts of their
+                latest representations
+        """
+        repre_entities_by_id = {
+            repre_entity["id"]: repre_entity
+            for repre_entity in ayon_api.get_representations(
+                project_name,
+                representation_ids={
+                    container["representation"]
+                    for container in containers
+                },
+                fields={"id", "name", "versionId"}
+            )
+        }
+        version_entities_by_id = {
+            version_entity["id"]: version_entity
+            for version_entity in ayon_api.get_versions(
+                project_name,
+                version_ids={
+                    repre_entity["versionId"]
+                    for repre_entity in repre_entities_by_id.values()
+                },
+                fields={"id", "productId"}
+            )
+        }
+        last_versions = ayon_api.get_last_versions(
+            project_name,
+            {
+                version_entity["productId"]
+                for version_entity in version_entities_by_id.values()
+            },
+            fields={"id", "productId"}
+        )
+        last_version_ids = {
+            version_entity["id"]
+            for version_entity in last_versions.values()
+            if version_entity
+        }
+
+        repre_ids_by_version_name = defaultdict(dict)
+        for repre_entity in ayon_api.get_representations(
+            project_name,
+            version_ids=last_version_ids,
+            fields={"id", "name", "versionId"}
+        ):
+            repre_ids_by_version_name[repre_entity["versionId"]][
+                repre_entity["name"]] = repre_entity["id"]
+
+        latest_repre_id_by_container = []
+        for container in containers:
+            repre_entity = repre_entities_by_id.get(
+                container["representation"])
+            if not repre_entity:
+                continue
+            version_entity = version_entities_by_id[repre_entity["versionId"]]
+            last_version = last_versions.get(version_entity["productId"])
+            if not last_version or last_version["id"] == version_entity["id"]:
+                continue
+
+            latest_repre_id = repre_ids_by_version_name[
+                last_version["id"]].get(repre_entity["name"])
+            if latest_repre_id:
+                latest_repre_id_by_container.append(
+                    (container, latest_repre_id))
+
+        contexts_by_repre_id = get_representation_contexts(
+            project_name,
+            {repre_id for _, repre_id in latest_repre_id_by_container}
+        )
+        return [
+            (container, contexts_by_repre_id[repre_id])
+            for container, repre_id in latest_repre_id_by_container
+            if repre_id in contexts_by_repre_id
+        ]
@@ -1,6 +1,9 @@
+from collections import defaultdict
+
 import ayon_api
 
-from ayon_core.pipeline import get_representation_path
+from ayon_core.pipeline import Anatomy
+from ayon_core.pipeline.load import get_representation_path_with_anatomy
 from ayon_core.lib.transcoding import (
     VIDEO_EXTENSIONS,
     IMAGE_EXTENSIONS
@@ -135,25 +138,73 @@ class LoadClip(phiero.SequenceLoader):
     def update(self, container, context):
         """ Updating previously loaded clips
         """
+        return self.update_many([(container, context)])[0]
+
+    def update_many(self, containers_contexts):
+        """Update multiple previously loaded clips at once.
+
+        Representation paths are resolved up front with one anatomy,
+        all media are reconnected in single undo group and clips are
+        colored by their version with single last versions query per
+        project.
+
+        Args:
+            containers_contexts (list[tuple[dict, dict]]): containers
+                with their new representation contexts
+
+        Returns:
+            list[bool]: result of container update per input item
+        """
+        anatomy_by_project = {}
+        updates = []
+        for container, context in containers_contexts:
+            project_name = context["project"]["name"]
+            anatomy = anatomy_by_project.get(project_name)
+            if anatomy is None:
+                anatomy = Anatomy(project_name)
+                anatomy_by_project[project_name] = anatomy
+
+            path = get_representation_path_with_anatomy(
+                context["representation"], anatomy)
+            updates.append(
+                (container, context, str(path).replace("\\", "/"))
+            )
+
+        project = phiero.get_current_project()
+        results = []
+        items_by_project = defaultdict(list)
+        with project.beginUndo("Update AYON clips"):
+            for container, context, path in updates:
+                track_item = container["_item"]
+                results.append(
+                    self._update_track_item(
+                        container, context, track_item, path)
+                )
+                items_by_project[context["project"]["name"]].append(
+                    (track_item, context["version"]))
+
+        # update color of clips regarding the version order
+        for project_name, items in items_by_project.items():
+            self.set_items_color(project_name, items)
+
+        return results
+
+    def _update_track_item(self, container, context, track_item, path):
         version_entity = context["version"]
         repre_entity = context["representation"]
 
-        # load clip to timeline and get main variables
         name = container["name"]
         namespace = container["namespace"]
-        track_item = phiero.get_track_items(
-            track_item_name=namespace).pop()
 
         version_attributes = version_entity["attrib"]
         version_name = version_entity["version"]
         colorspace = version_attributes.get("colorSpace")
         object_name = "{}_{}".format(name, namespace)
 
-        file = get_representation_path(repre_entity).replace("\\", "/")
         clip = track_item.source()
 
         # reconnect media to new path
-        clip.reconnectMedia(file)
+        clip.reconnectMedia(path)
 
         # set colorspace
         if colorspace:
@@ -184,20 +235,13 @@ class LoadClip(phiero.SequenceLoader):
             "objectName": object_name
         })
 
-        # update color of clip regarding the version order
-        self.set_item_color(
-            context["project"]["name"], track_item, version_entity
-        )
-
         return phiero.update_container(track_item, data_imprint)
 
     def remove(self, container):
         """ Removing previously loaded clips
         """
         # load clip to timeline and get main variables
-        namespace = container['namespace']
-        track_item = phiero.get_track_items(
-            track_item_name=namespace).pop()
+        track_item = container["_item"]
         track = track_item.parent()
 
         # remove track item from track
@@ -211,12 +255,31 @@ class LoadClip(phiero.SequenceLoader):
 
     @classmethod
     def set_item_color(cls, project_name, track_item, version_entity):
-        last_version_entity = ayon_api.get_last_version_by_product_id(
-            project_name, version_entity["productId"], fields={"id"}
+        cls.set_items_color(project_name, [(track_item, version_entity)])
+
+    @classmethod
+    def set_items_color(cls, project_name, items):
+        """Color clips by their version with single last versions query.
+
+        Args:
+            project_name (str): project name
+            items (list[tuple[hiero.core.TrackItem, dict]]): track items
+                with their version entities
+        """
+        last_versions = ayon_api.get_last_versions(
+            project_name,
+            {version_entity["productId"] for _, version_entity in items},
+            fields={"id"}
         )
-        clip = track_item.source()
-        # set clip colour
-        if version_entity["id"] == last_version_entity["id"]:
-            clip.binItem().setColor(cls.clip_color_last)
-        else:
-            clip.binItem().setColor(cls.clip_color)
+        for track_item, version_entity in items:
+            clip = track_item.source()
+            last_version_entity = last_versions.get(
+                version_entity["productId"])
+            # set clip colour
+            if (
+                last_version_entity
+                and version_entity["id"] == last_version_entity["id"]
+            ):
+                clip.binItem().setColor(cls.clip_color_last)
+            else:
+                clip.binItem().setColor(cls.clip_color)
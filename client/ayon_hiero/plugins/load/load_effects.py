@@ -1,4 +1,5 @@
 import json
+import hashlib
 from collections import OrderedDict
 
 from ayon_core.pipeline import (
@@ -7,11 +8,16 @@ from ayon_core.pipeline import (
     get_representation_path,
 )
 from ayon_hiero import api as phiero
+from ayon_hiero.api import effects as effects_schema
 from ayon_core.lib import Logger
 
 
 class LoadEffects(load.LoaderPlugin):
-    """Loading colorspace soft effect exported from nukestudio"""
+    """Loading colorspace soft effect exported from nukestudio
+
+    Reads effects json of schema version 1 with dense per frame animation
+    and version 2 with keyframed animation.
+    """
 
     product_base_types = {"effect"}
     product_types = product_base_types
@@ -25,6 +31,10 @@ class LoadEffects(load.LoaderPlugin):
 
     log = Logger.get_logger(__name__)
 
+    # presets
+    reduce_keyframes = True
+    keyframe_tolerance = 0.0001
+
     def load(self, context, name, namespace, data):
         """
         Loading function to get the soft effects to particular read node
@@ -50,7 +60,8 @@ class LoadEffects(load.LoaderPlugin):
 
         data_imprint = {
             "objectName": object_name,
-            "children_names": []
+            "children_names": [],
+            "children_digests": {}
         }
 
         # getting file path
@@ -80,24 +91,67 @@ class LoadEffects(load.LoaderPlugin):
         clip_in,
         clip_out,
         data_imprint,
-        update=False
+        update=False,
+        used_subtracks=None,
+        previous_digests=None,
+        previous_file_digest=None
     ):
-        # getting data from json file with unicode conversion
-        with open(file, "r") as f:
-            json_f = {self.byteify(key): self.byteify(value)
-                      for key, value in json.load(f).items()}
+        with open(file, "rb") as f:
+            content = f.read()
+        json_f = json.loads(content)
+
+        # whole file digest is cheap, effect digests are computed only
+        #   on update when file changed
+        file_digest = hashlib.md5(content).hexdigest()
+        data_imprint["file_digest"] = file_digest
+        file_changed = file_digest != previous_file_digest
+
+        schema_version = effects_schema.get_schema_version(json_f)
+        if schema_version > effects_schema.EFFECTS_SCHEMA_VERSION:
+            self.log.warning(
+                "Effects schema version {} is newer than supported {}".format(
+                    schema_version, effects_schema.EFFECTS_SCHEMA_VERSION))
 
         # get correct order of nodes by positions on track and subtrack
         nodes_order = self.reorder_nodes(json_f)
 
-        used_subtracks = {
-            stitem.name(): stitem
-            for stitem in phiero.flatten(active_track.subTrackItems())
-        }
+        if used_subtracks is None:
+            used_subtracks = self.get_used_subtracks(active_track)
+        previous_digests = previous_digests or {}
 
         loaded = False
+        anim_calls = 0
+        dense_anim_calls = 0
+        skipped_names = []
         for index_order, (ef_name, ef_val) in enumerate(nodes_order.items()):
             new_name = "{}_loaded".format(ef_name)
+            digest = None
+            if update:
+                digest = previous_digests.get(new_name)
+                if file_changed or digest is None:
+                    digest = self.get_effect_digest(ef_val)
+
+            # register all loaded children
+            data_imprint["children_names"].append(new_name)
+            if digest is not None:
+                data_imprint["children_digests"][new_name] = digest
+
+            # make sure containerisation will happen
+            loaded = True
+
+            if (
+                update
+                and new_name in used_subtracks
+                and (
+                    not file_changed
+                    or previous_digests.get(new_name) == digest
+                )
+                and used_subtracks[new_name].timelineIn() == clip_in
+                and used_subtracks[new_name].timelineOut() == clip_out
+            ):
+                skipped_names.append(new_name)
+                continue
+
             if new_name not in used_subtracks:
                 effect_track_item = active_track.createEffect(
                     effectType=ef_val["class"],
@@ -109,49 +163,110 @@ class LoadEffects(load.LoaderPlugin):
                 effect_track_item.setName(new_name)
             else:
                 effect_track_item = used_subtracks[new_name]
+                if update:
+                    # reuse previously loaded item in place
+                    effect_track_item.setTimelineIn(clip_in)
+                    effect_track_item.setTimelineOut(clip_out)
 
             node = effect_track_item.node()
             for knob_name, knob_value in ef_val["node"].items():
-                if (
-                    not knob_value
-                    or knob_name == "name"
-                ):
+                if knob_name == "name":
                     continue
 
                 try:
-                    # assume list means animation
-                    # except 4 values could be RGBA or vector
-                    if isinstance(knob_value, list) and len(knob_value) > 4:
+                    # drop animation of previously loaded version
+                    if update and node[knob_name].isAnimated():
+                        node[knob_name].clearAnimated()
+
+                    # new effects keep defaults of empty values, updated
+                    #   effects have to reset values of previous version
+                    if knob_value is None or (not update and not knob_value):
+                        continue
+
+                    if effects_schema.is_keys_animation(knob_value):
+                        node[knob_name].setAnimated()
+                        for channel, keys in (
+                            effects_schema.get_animation_keys(knob_value)
+                        ):
+                            self.set_knob_keys(
+                                node[knob_name], keys, clip_in, channel)
+                    elif effects_schema.is_dense_animation(knob_value):
                         node[knob_name].setAnimated()
-                        for i, value in enumerate(knob_value):
-                            if isinstance(value, list):
-                                # list can have vector animation
-                                for ci, cv in enumerate(value):
-                                    node[knob_name].setValueAt(
-                                        cv,
-                                        (clip_in + i),
-                                        ci
-                                    )
-                            else:
-                                # list is single values
-                                node[knob_name].setValueAt(
-                                    value,
-                                    (clip_in + i)
-                                )
+                        for channel, values in (
+                            effects_schema.get_animation_channels(knob_value)
+                        ):
+                            dense_anim_calls += len(values)
+                            anim_calls += self.set_knob_animation(
+                                node[knob_name], values, clip_in, channel)
                     else:
                         node[knob_name].setValue(knob_value)
-                except NameError:
+                except (NameError, TypeError, ValueError):
                     self.log.warning("Knob: {} cannot be set".format(
                         knob_name))
 
-            # register all loaded children
-            data_imprint["children_names"].append(new_name)
+        if skipped_names:
+            self.log.debug(
+                "Effects not changed since previous version: {}".format(
+                    ", ".join(skipped_names)))
 
-            # make sure containerisation will happen
-            loaded = True
+        if dense_anim_calls:
+            self.log.debug(
+                "Animation applied with {} keyframes instead of {} "
+                "({} calls saved)".format(
+                    anim_calls,
+                    dense_anim_calls,
+                    dense_anim_calls - anim_calls
+                )
+            )
 
         return loaded
 
+    def set_knob_animation(self, knob, values, clip_in, channel=None):
+        """Set animation of knob from values per frame.
+
+        Arguments:
+            knob (hiero.core.nuke.Knob): knob of soft effect node
+            values (list): value per frame starting at `clip_in`
+            clip_in (int): timeline frame of first value
+            channel (Optional[int]): channel index of vector knob
+
+        Returns:
+            int: number of keyframes set
+        """
+        if self.reduce_keyframes:
+            frames = effects_schema.get_keyframe_indexes(
+                values, self.keyframe_tolerance)
+        else:
+            frames = range(len(values))
+
+        return self.set_knob_keys(
+            knob,
+            [(index, values[index]) for index in frames],
+            clip_in,
+            channel
+        )
+
+    @staticmethod
+    def set_knob_keys(knob, keys, clip_in, channel=None):
+        """Set keyframes of knob.
+
+        Arguments:
+            knob (hiero.core.nuke.Knob): knob of soft effect node
+            keys (list[tuple[int, Any]]): frame index relative to
+                `clip_in` with value
+            clip_in (int): timeline frame of index 0
+            channel (Optional[int]): channel index of vector knob
+
+        Returns:
+            int: number of keyframes set
+        """
+        for index, value in keys:
+            args = [value, clip_in + index]
+            if channel is not None:
+                args.append(channel)
+            knob.setValueAt(*args)
+        return len(keys)
+
     def update(self, container, context):
         """ Updating previously loaded effects
         """
@@ -171,85 +286,99 @@ class LoadEffects(load.LoaderPlugin):
 
         object_name = "{}_{}".format(name, namespace)
 
-        # Disable previously created nodes
-        used_subtracks = {
-            stitem.name(): stitem
-            for stitem in phiero.flatten(active_track.subTrackItems())
-        }
+        used_subtracks = self.get_used_subtracks(active_track)
         container = phiero.get_track_ayon_data(
             active_track, object_name
         )
-
         loaded_subtrack_items = container["children_names"]
-        for loaded_stitem in loaded_subtrack_items:
-            if loaded_stitem not in used_subtracks:
-                continue
-            item_to_remove = used_subtracks.pop(loaded_stitem)
-            # TODO: find a way to erase nodes
-            self.log.debug(
-                "This node needs to be removed: {}".format(item_to_remove))
 
         data_imprint = {
             "objectName": object_name,
             "name": name,
             "representation": repre_entity["id"],
-            "children_names": []
+            "children_names": [],
+            "children_digests": {}
         }
 
-        if self._shared_loading(
+        if not self._shared_loading(
             file,
             active_track,
             clip_in,
             clip_out,
             data_imprint,
-            update=True
+            update=True,
+            used_subtracks=used_subtracks,
+            previous_digests=container.get("children_digests"),
+            previous_file_digest=container.get("file_digest")
         ):
-            return phiero.update_container(active_track, data_imprint)
+            return
 
-    def reorder_nodes(self, data):
-        new_order = OrderedDict()
-        trackNums = [v["trackIndex"] for k, v in data.items()
-                     if isinstance(v, dict)]
-        subTrackNums = [v["subTrackIndex"] for k, v in data.items()
-                        if isinstance(v, dict)]
-
-        for trackIndex in range(
-                min(trackNums), max(trackNums) + 1):
-            for subTrackIndex in range(
-                    min(subTrackNums), max(subTrackNums) + 1):
-                item = self.get_item(data, trackIndex, subTrackIndex)
-                if item:
-                    new_order.update(item)
-        return new_order
-
-    def get_item(self, data, trackIndex, subTrackIndex):
-        return {key: val for key, val in data.items()
-                if isinstance(val, dict)
-                if subTrackIndex == val["subTrackIndex"]
-                if trackIndex == val["trackIndex"]}
-
-    def byteify(self, input):
-        """
-        Converts unicode strings to strings
-        It goes through all dictionary
+        # remove previously loaded items missing in new version
+        children_names = set(data_imprint["children_names"])
+        for loaded_stitem in loaded_subtrack_items:
+            if (
+                loaded_stitem in children_names
+                or loaded_stitem not in used_subtracks
+            ):
+                continue
+            self.log.debug(
+                "Removing effect not present in new version: {}".format(
+                    loaded_stitem))
+            active_track.removeSubTrackItem(
+                used_subtracks.pop(loaded_stitem))
+
+        return phiero.update_container(active_track, data_imprint)
+
+    @staticmethod
+    def get_effect_digest(effect):
+        """Digest of effect data independent of key order in json.
 
         Arguments:
-            input (dict/str): input
+            effect (dict): effect data
 
         Returns:
-            dict: with fixed values and keys
+            str: md5 hex digest
+        """
+        return hashlib.md5(
+            json.dumps(effect, sort_keys=True).encode("utf-8")
+        ).hexdigest()
 
+    @staticmethod
+    def get_used_subtracks(active_track):
+        """Get subtrack items of track by their names.
+
+        Arguments:
+            active_track (hiero.core.VideoTrack): track with effects
+
+        Returns:
+            dict[str, hiero.core.EffectTrackItem]: items by name
         """
+        return {
+            stitem.name(): stitem
+            for stitem in phiero.flatten(active_track.subTrackItems())
+        }
 
-        if isinstance(input, dict):
-            return {self.byteify(key): self.byteify(value)
-                    for key, value in input.items()}
-        elif isinstance(input, list):
-            return [self.byteify(element) for element in input]
-        elif isinstance(input, str):
-            return str(input)
-        else:
-            return input
+    def reorder_nodes(self, data):
+        """Order effects by their track and subtrack position.
+
+        Sort is stable so effects on the same position keep order
+        in which they are stored in data.
+
+        Arguments:
+            data (dict): effects data loaded from json
+
+        Returns:
+            OrderedDict: effects ordered by track and subtrack index
+        """
+        return OrderedDict(sorted(
+            (
+                (key, value) for key, value in data.items()
+                if isinstance(value, dict)
+            ),
+            key=lambda item: (
+                item[1]["trackIndex"], item[1]["subTrackIndex"]
+            )
+        ))
 
     def switch(self, container, context):
         self.update(container, context)
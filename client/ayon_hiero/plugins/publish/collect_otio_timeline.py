@@ -12,11 +12,22 @@ class CollectOTIOTimeline(pyblish.api.ContextPlugin):
     label = "Collect OTIO Timeline"
     hosts = ["hiero"]
     order = pyblish.api.CollectorOrder - 0.491
+    settings_category = "hiero"
 
-    def process(self, context):
-        otio_timeline = hiero_export.create_otio_timeline()
+    # presets
+    partial_export = True
 
+    def process(self, context):
         active_timeline = hiero.ui.activeSequence()
+
+        export_filter = {}
+        if self.partial_export:
+            export_filter = self.get_export_filter(context, active_timeline)
+            self.log.debug(f"OTIO timeline export filter: {export_filter}")
+
+        otio_timeline = hiero_export.create_otio_timeline(
+            active_timeline, **export_filter)
+
         project = active_timeline.project()
         fps = active_timeline.framerate().toFloat()
 
@@ -27,12 +38,91 @@ class CollectOTIOTimeline(pyblish.api.ContextPlugin):
             "activeProject": project,
             "activeTimeline": active_timeline,
             "otioTimeline": otio_timeline,
+            "otioTimelineIsPartial": bool(export_filter),
             "colorspace": self.get_colorspace(project),
             "fps": fps,
             "tracksEffectItems": tracks_effect_items,
         }
         context.data.update(context_data)
 
+    @staticmethod
+    def get_export_filter(context, sequence):
+        """Get tracks and frame range needed by active instances.
+
+        Args:
+            context (pyblish.api.Context): publishing context
+            sequence (hiero.core.Sequence): active sequence
+
+        Returns:
+            dict: `tracks` and `frame_range` keyword arguments for
+                `create_otio_timeline`, empty if full export is needed
+        """
+        # requested handles by clip index
+        handles_by_clip_index = {}
+        track_names = set()
+        include_audio = False
+        for instance in context:
+            if not instance.data.get("publish", True):
+                continue
+
+            product_type = instance.data.get("productType")
+            if product_type == "editorial_pkg":
+                # editorial package needs whole timeline
+                if instance.data.get("guid") == sequence.guid():
+                    return {}
+                continue
+
+            clip_index = instance.data.get("clip_index")
+            if not clip_index:
+                continue
+
+            # handles are in creator attributes until shots are collected
+            creator_attributes = instance.data.get("creator_attributes", {})
+            handles = handles_by_clip_index.setdefault(clip_index, [0, 0])
+            for index, key in enumerate(("handleStart", "handleEnd")):
+                value = instance.data.get(key, creator_attributes.get(key))
+                if value:
+                    handles[index] = max(handles[index], int(value))
+
+            if product_type == "audio":
+                include_audio = True
+
+            review_source = creator_attributes.get("reviewableSource")
+            if review_source and review_source != "clip_media":
+                track_names.add(review_source)
+
+        frame_start = frame_end = None
+        for track in sequence.videoTracks():
+            for track_item in track.items():
+                handles = handles_by_clip_index.get(track_item.guid())
+                if handles is None:
+                    continue
+
+                track_names.add(track.name())
+                # include requested handles even beyond available media
+                #   so other tracks keep their items in handle range
+                item_start = track_item.timelineIn() - max(
+                    handles[0], track_item.handleInLength())
+                item_end = track_item.timelineOut() + max(
+                    handles[1], track_item.handleOutLength())
+                if frame_start is None or item_start < frame_start:
+                    frame_start = item_start
+                if frame_end is None or item_end > frame_end:
+                    frame_end = item_end
+
+        if include_audio:
+            track_names.update(
+                track.name() for track in sequence.audioTracks())
+
+        if frame_start is None:
+            # no instance needs any track item
+            return {"tracks": sorted(track_names), "frame_range": None}
+
+        return {
+            "tracks": sorted(track_names),
+            "frame_range": (int(frame_start), int(frame_end)),
+        }
+
     def get_colorspace(self, project):
         # get workfile's colorspace properties
         return {
@@ -1,8 +1,10 @@
 import os
 import json
+
 import pyblish.api
 
 from ayon_core.pipeline import publish
+from ayon_hiero.api import effects as effects_schema
 
 
 class ExtractClipEffects(publish.Extractor):
@@ -11,6 +13,13 @@ class ExtractClipEffects(publish.Extractor):
     order = pyblish.api.ExtractorOrder
     label = "Export Clip Effects"
     families = ["effect"]
+    settings_category = "hiero"
+
+    # presets
+    # version 2 stores animation as keyframes, version 1 as value
+    #   per frame for loaders which do not support version 2
+    schema_version = 1
+    keyframe_tolerance = 0.0001
 
     def process(self, instance):
         item = instance.data["trackItem"]
@@ -36,11 +45,12 @@ class ExtractClipEffects(publish.Extractor):
         # when instance is created during collection part
         resources_dir = instance.data["resourcesDir"]
 
-        # change paths in effects to files
+        # change paths in effects to files, each file is transferred once
+        transferred = {}
         for k, effect in effects.items():
             if "assignTo" in k:
                 continue
-            trn = self.copy_linked_files(effect, resources_dir)
+            trn = self.copy_linked_files(effect, resources_dir, transferred)
             if trn:
                 transfers.append((trn[0], trn[1]))
 
@@ -87,15 +97,40 @@ class ExtractClipEffects(publish.Extractor):
         self.log.debug("_ version_data: `{}`".format(
             instance.data["versionData"]))
 
-        with open(os.path.join(staging_dir, file), "w") as outfile:
-            outfile.write(json.dumps(effects, indent=4, sort_keys=True))
+        if self.schema_version >= 2:
+            effects = effects_schema.encode_effects(
+                effects, self.keyframe_tolerance)
 
-    def copy_linked_files(self, effect, dst_dir):
+        with open(os.path.join(staging_dir, file), "w") as outfile:
+            json.dump(
+                effects, outfile, sort_keys=True, separators=(",", ":")
+            )
+
+    def copy_linked_files(self, effect, dst_dir, transferred):
+        """Point file knob of effect to published resource.
+
+        Args:
+            effect (dict): effect data
+            dst_dir (str): resources directory of instance
+            transferred (dict[str, str]): destination by source path of
+                files already transferred for the instance
+
+        Returns:
+            Optional[tuple[str, str]]: source and destination of transfer
+                or None if the file is already transferred
+        """
         for k, v in effect["node"].items():
             if k in "file" and isinstance(v, str) and v != '':
-                base_name = os.path.basename(v)
-                dst = os.path.join(dst_dir, base_name).replace("\\", "/")
+                src_key = os.path.normpath(v)
+                dst = transferred.get(src_key)
+                if dst is None:
+                    base_name = os.path.basename(v)
+                    dst = os.path.join(dst_dir, base_name).replace("\\", "/")
+                    transferred[src_key] = dst
+                    trn = (v, dst)
+                else:
+                    trn = None
 
                 # add it to the json
                 effect["node"][k] = dst
-                return (v, dst)
+                return trn
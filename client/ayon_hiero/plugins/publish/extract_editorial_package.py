@@ -63,25 +63,61 @@ class ExtractEditorialPackage(publish.Extractor):
         )
 
         # Remap all media clips from the timeline
+        # - track position is accumulated while iterating as
+        #   `range_in_parent` would walk all previous siblings per clip
         for track in otio_timeline.tracks:
+            position = otio.opentime.RationalTime(0, timeline_fps)
             for clip in track:
-                if (
-                    not hasattr(clip, "media_reference")
-                ):
-                    # Skip non-media related clips
+                if clip.overlapping():
+                    # Transitions are not taking any space on track
                     continue
 
-                clip.media_reference = new_media_reference
-                clip.source_range = otio.opentime.TimeRange(
-                    start_time=otio.opentime.RationalTime(
-                        value=(
-                            timeline_start_frame
-                            + clip.range_in_parent().start_time.value
+                duration = clip.duration()
+                if hasattr(clip, "media_reference"):
+                    clip.media_reference = new_media_reference
+                    clip.source_range = otio.opentime.TimeRange(
+                        start_time=otio.opentime.RationalTime(
+                            value=timeline_start_frame + position.value,
+                            rate=timeline_fps,
                         ),
-                        rate=timeline_fps,
-                    ),
-                    duration=clip.range_in_parent().duration,
+                        duration=duration,
+                    )
+
+                position += duration
+
+    @staticmethod
+    def _get_otio_timeline(
+            instance: pyblish.api.Instance,
+            sequence,
+        ) -> otio.schema.Timeline:
+        """Get copy of sequence otio timeline exported once per publish.
+
+        Timeline of active sequence collected by `CollectOTIOTimeline`
+        is reused when it contains all tracks. Other sequences are
+        exported only once and cached in context data.
+        """
+        context = instance.context
+        cached_timelines = context.data.setdefault(
+            "otioTimelinesBySequence", {})
+
+        guid = sequence.guid()
+        otio_timeline = cached_timelines.get(guid)
+        if otio_timeline is None:
+            active_timeline = context.data.get("activeTimeline")
+            if (
+                active_timeline is not None
+                and active_timeline.guid() == guid
+                and not context.data.get("otioTimelineIsPartial")
+            ):
+                otio_timeline = context.data["otioTimeline"]
+            else:
+                otio_timeline = hiero_export.create_otio_timeline(
+                    sequence=sequence,
                 )
+            cached_timelines[guid] = otio_timeline
+
+        # clips are remapped so shared timeline must stay untouched
+        return deepcopy(otio_timeline)
 
     def process(self, instance: pyblish.api.Instance):
         instance.data.setdefault("representations", [])
@@ -116,9 +152,7 @@ class ExtractEditorialPackage(publish.Extractor):
         )
 
         # Export sequence as OTIO but remap to rendered consolidated media
-        otio_timeline = hiero_export.create_otio_timeline(
-            sequence=seq,
-        )
+        otio_timeline = self._get_otio_timeline(instance, seq)
         self._remap_all_clips_to_media(
             otio_timeline,
             published_path,
@@ -1,7 +1,12 @@
 import os
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pyblish.api
 
 from ayon_core.lib import (
+    get_ffmpeg_tool_args,
     get_oiio_tool_args,
     run_subprocess,
 )
@@ -9,64 +14,77 @@ from ayon_core.pipeline import publish
 
 
 class ExtractFrames(publish.Extractor):
-    """Extracts frames"""
+    """Extracts frames
+
+    Frames are grouped by their source media, frames of each image
+    sequence are extracted by single `oiiotool` process, frames of movies
+    by single `ffmpeg` decode pass. Groups run in parallel, number of
+    concurrent processes is limited by `max_workers`, value 1 extracts
+    groups one after another.
+    """
 
     order = pyblish.api.ExtractorOrder
     label = "Extract Frames"
     hosts = ["hiero"]
     families = ["frame"]
+    settings_category = "hiero"
+
     movie_extensions = ["mov", "mp4"]
 
+    # presets
+    max_workers = 4
+
     def process(self, instance):
         oiio_tool_args = get_oiio_tool_args("oiiotool")
         staging_dir = self.staging_dir(instance)
         output_template = os.path.join(staging_dir, instance.data["name"])
+        output_ext = instance.data["format"]
         sequence = instance.context.data["activeTimeline"]
 
-        files = []
-        for frame in instance.data["frames"]:
-            track_item = sequence.trackItemAt(frame)
-            media_source = track_item.source().mediaSource()
-            input_path = media_source.fileinfos()[0].filename()
-            input_frame = (
-                track_item.mapTimelineToSource(frame) +
-                track_item.source().mediaSource().startTime()
+        frames = sorted(instance.data["frames"])
+        output_paths = OrderedDict(
+            (
+                frame,
+                "{}.{:04d}.{}".format(output_template, int(frame), output_ext)
             )
-            output_ext = instance.data["format"]
-            output_path = output_template
-            output_path += ".{:04d}.{}".format(int(frame), output_ext)
-
-            args = list(oiio_tool_args)
+            for frame in frames
+        )
 
-            ext = os.path.splitext(input_path)[1][1:]
-            if ext in self.movie_extensions:
-                args.extend(["--subimage", str(int(input_frame))])
-            else:
-                args.extend(["--frames", str(int(input_frame))])
-
-            if ext == "exr":
-                args.extend(["--powc", "0.45,0.45,0.45,1.0"])
-
-            args.extend([input_path, "-o", output_path])
-            output = run_subprocess(args)
+        # Hiero api is accessed only from publish thread
+        frames_by_input_path = OrderedDict()
+        for frame, input_path, input_frame in self.get_frame_sources(
+                sequence, frames):
+            frames_by_input_path.setdefault(input_path, []).append(
+                (int(input_frame), output_paths[frame])
+            )
 
-            failed_output = "oiiotool produced no output."
-            if failed_output in output:
-                raise ValueError(
-                    "oiiotool processing failed. Args: {}".format(args)
+        max_workers = max(1, min(self.max_workers, len(frames_by_input_path)))
+        processed_frames = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.extract_source_frames,
+                    oiio_tool_args,
+                    input_path,
+                    source_frames,
+                    output_ext,
+                    "{}_source{}".format(output_template, index),
                 )
+                for index, (input_path, source_frames) in enumerate(
+                    frames_by_input_path.items())
+            ]
+            for future in as_completed(futures):
+                processed_frames += future.result()
 
-            files.append(output_path)
-
-            # Feedback to user because "oiiotool" can make the publishing
-            # appear unresponsive.
-            self.log.info(
-                "Processed {} of {} frames".format(
-                    instance.data["frames"].index(frame) + 1,
-                    len(instance.data["frames"])
+                # Feedback to user because "oiiotool" can make the publishing
+                # appear unresponsive.
+                self.log.info(
+                    "Processed {} of {} frames".format(
+                        processed_frames, len(frames)
+                    )
                 )
-            )
 
+        files = list(output_paths.values())
         if len(files) == 1:
             instance.data["representations"] = [
                 {
@@ -85,3 +103,219 @@ class ExtractFrames(publish.Extractor):
                     "stagingDir": staging_dir
                 }
             ]
+
+    def get_frame_sources(self, sequence, frames):
+        """Get source media and source frame of timeline frames.
+
+        Frames are resolved against track item ranges in one sweep over
+        sorted frames, media of each track item is queried only once.
+
+        Args:
+            sequence (hiero.core.Sequence): active timeline
+            frames (list[int]): sorted timeline frames
+
+        Returns:
+            list[tuple[int, str, int]]: timeline frame, input path and
+                frame in input media
+        """
+        frames_by_track_item = OrderedDict()
+        for frame, track_item in self.get_frames_track_items(
+                sequence, frames):
+            frames_by_track_item.setdefault(track_item, []).append(frame)
+
+        frame_sources = []
+        for track_item, item_frames in frames_by_track_item.items():
+            media_source = track_item.source().mediaSource()
+            input_path = media_source.fileinfos()[0].filename()
+            start_time = media_source.startTime()
+
+            # source mapping is linear within track item
+            first_frame = item_frames[0]
+            first_source_frame = track_item.mapTimelineToSource(first_frame)
+            speed = track_item.playbackSpeed()
+            for frame in item_frames:
+                input_frame = (
+                    first_source_frame
+                    + (frame - first_frame) * speed
+                    + start_time
+                )
+                frame_sources.append((frame, input_path, input_frame))
+
+        frame_sources.sort(key=lambda item: item[0])
+        return frame_sources
+
+    @staticmethod
+    def get_frames_track_items(sequence, frames):
+        """Find top-most track item under each of sorted frames.
+
+        Args:
+            sequence (hiero.core.Sequence): active timeline
+            frames (list[int]): sorted timeline frames
+
+        Yields:
+            tuple[int, hiero.core.TrackItem]: frame with its track item
+        """
+        # top-most tracks first, disabled tracks and items are not
+        #   visible on timeline
+        tracks_ranges = [
+            sorted(
+                (
+                    (item.timelineIn(), item.timelineOut(), item)
+                    for item in track.items()
+                    if item.isEnabled()
+                ),
+                key=lambda item_range: item_range[0]
+            )
+            for track in reversed(sequence.videoTracks())
+            if track.isEnabled()
+        ]
+        range_indexes = [0] * len(tracks_ranges)
+
+        for frame in frames:
+            found_item = None
+            for track_index, item_ranges in enumerate(tracks_ranges):
+                range_index = range_indexes[track_index]
+                # skip items which end before current frame
+                while (
+                    range_index < len(item_ranges)
+                    and item_ranges[range_index][1] < frame
+                ):
+                    range_index += 1
+                range_indexes[track_index] = range_index
+
+                if (
+                    range_index < len(item_ranges)
+                    and item_ranges[range_index][0] <= frame
+                ):
+                    found_item = item_ranges[range_index][2]
+                    break
+
+            if found_item is None:
+                found_item = sequence.trackItemAt(frame)
+            yield frame, found_item
+
+    def extract_source_frames(
+        self, oiio_tool_args, input_path, source_frames, output_ext,
+        tmp_template
+    ):
+        """Extract frames of one source media.
+
+        Frames of image sequences are converted by single `oiiotool`
+        invocation, frames of movies by single `ffmpeg` decode pass
+        regardless of number of frames so all movie frames are decoded
+        the same way.
+
+        Args:
+            oiio_tool_args (list[str]): oiiotool executable arguments
+            input_path (str): path to source media
+            source_frames (list[tuple[int, str]]): frame in source media
+                with output path
+            output_ext (str): output extension
+            tmp_template (str): unique path template of frames named
+                by input frames before they are renamed
+
+        Returns:
+            int: number of extracted frames
+        """
+        ext = os.path.splitext(input_path)[1][1:]
+        input_frames = sorted({frame for frame, _ in source_frames})
+        if ext in self.movie_extensions:
+            tmp_path_by_input_frame = self._extract_movie_frames(
+                input_path, input_frames, output_ext, tmp_template
+            )
+        elif len(source_frames) == 1:
+            input_frame, output_path = source_frames[0]
+            self._run_oiiotool(
+                oiio_tool_args, input_path, ext, input_frame, output_path
+            )
+            return 1
+        else:
+            # oiiotool names outputs of sequence by input frames
+            self._run_oiiotool(
+                oiio_tool_args,
+                input_path,
+                ext,
+                ",".join(str(frame) for frame in input_frames),
+                "{}.%04d.{}".format(tmp_template, output_ext)
+            )
+            tmp_path_by_input_frame = {
+                frame: "{}.{:04d}.{}".format(tmp_template, frame, output_ext)
+                for frame in input_frames
+            }
+
+        for input_frame, output_path in source_frames:
+            tmp_path = tmp_path_by_input_frame[input_frame]
+            if not os.path.exists(tmp_path):
+                raise ValueError(
+                    "Frame {} of {} was not extracted".format(
+                        input_frame, input_path)
+                )
+            shutil.copyfile(tmp_path, output_path)
+
+        for tmp_path in tmp_path_by_input_frame.values():
+            os.remove(tmp_path)
+
+        return len(source_frames)
+
+    def _extract_movie_frames(
+        self, input_path, input_frames, output_ext, tmp_template
+    ):
+        """Extract multiple frames of movie in one decode pass.
+
+        Args:
+            input_path (str): path to movie
+            input_frames (list[int]): sorted unique frame indexes
+            output_ext (str): output extension
+            tmp_template (str): path template of extracted frames
+
+        Returns:
+            dict[int, str]: extracted path by frame index
+        """
+        # contiguous frames are selected by single expression
+        ranges = []
+        for frame in input_frames:
+            if ranges and ranges[-1][1] + 1 == frame:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+        select_expr = "+".join(
+            "between(n,{},{})".format(start, end)
+            for start, end in ranges
+        )
+
+        args = get_ffmpeg_tool_args(
+            "ffmpeg",
+            "-y",
+            "-i", input_path,
+            "-vf", "select='{}'".format(select_expr),
+            "-vsync", "0",
+            # stop decoding after last selected frame
+            "-frames:v", str(len(input_frames)),
+            "-start_number", "0",
+            "{}.%04d.{}".format(tmp_template, output_ext)
+        )
+        run_subprocess(args)
+
+        # ffmpeg numbers outputs in order of selected frames
+        return {
+            frame: "{}.{:04d}.{}".format(tmp_template, index, output_ext)
+            for index, frame in enumerate(input_frames)
+        }
+
+    def _run_oiiotool(
+        self, oiio_tool_args, input_path, ext, input_frames, output_path
+    ):
+        args = list(oiio_tool_args)
+        args.extend(["--frames", str(input_frames)])
+
+        if ext == "exr":
+            args.extend(["--powc", "0.45,0.45,0.45,1.0"])
+
+        args.extend([input_path, "-o", output_path])
+        output = run_subprocess(args)
+
+        failed_output = "oiiotool produced no output."
+        if failed_output in output:
+            raise ValueError(
+                "oiiotool processing failed. Args: {}".format(args)
+            )
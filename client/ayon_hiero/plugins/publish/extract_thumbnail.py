@@ -1,7 +1,15 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pyblish.api
+import opentimelineio as otio
 
+from ayon_core.lib import (
+    get_oiio_tool_args,
+    run_subprocess,
+)
 from ayon_core.pipeline import publish
+from ayon_hiero.api import lib, thumbnail_cache
 
 
 class ExtractThumbnail(publish.Extractor):
@@ -13,6 +21,17 @@ class ExtractThumbnail(publish.Extractor):
     order = pyblish.api.ExtractorOrder
     families = ["plate", "take"]
     hosts = ["hiero"]
+    settings_category = "hiero"
+
+    movie_extensions = ["mov", "mp4"]
+
+    # presets
+    use_cache = True
+    cache_max_size_mb = 512
+    # "hiero" renders thumbnails through track items, "oiiotool" renders
+    #   all thumbnails of the publish from otio media references at once
+    thumbnail_mode = "hiero"
+    max_workers = 4
 
     def process(self, instance):
         # create representation data
@@ -21,8 +40,165 @@ class ExtractThumbnail(publish.Extractor):
 
         staging_dir = self.staging_dir(instance)
 
+        if self.thumbnail_mode == "oiiotool":
+            thumb_path = self.get_external_thumbnail(instance)
+            if thumb_path:
+                self.log.info(
+                    "Thumbnail was generated to: {}".format(thumb_path))
+                self._add_representation(
+                    instance, staging_dir, os.path.basename(thumb_path))
+                return
+
+            self.log.debug(
+                "Media of instance can't be read by oiiotool,"
+                " rendering thumbnail in Hiero."
+            )
+
         self.create_thumbnail(staging_dir, instance)
 
+    def get_external_thumbnail(self, instance):
+        """Get thumbnail rendered outside of Hiero.
+
+        Thumbnails of all instances in context are rendered by first
+        processed instance with bounded pool of `oiiotool` processes.
+
+        Returns:
+            Optional[str]: path to thumbnail or None if media of
+                instance could not be read
+        """
+        context = instance.context
+        thumbnails = context.data.get("hieroExternalThumbnails")
+        if thumbnails is None:
+            thumbnails = self.render_external_thumbnails(context)
+            context.data["hieroExternalThumbnails"] = thumbnails
+        return thumbnails.get(instance.id)
+
+    def render_external_thumbnails(self, context):
+        """Render thumbnails of all context instances from otio media.
+
+        Returns:
+            dict[str, Optional[str]]: thumbnail path by instance id
+        """
+        jobs = []
+        for instance in context:
+            if not instance.data.get("publish", True):
+                continue
+            families = set(instance.data.get("families", []))
+            families.add(instance.data.get("family"))
+            if not families.intersection(self.families):
+                continue
+
+            job = self.get_thumbnail_job(instance)
+            if job:
+                jobs.append(job)
+
+        if not jobs:
+            return {}
+
+        oiio_tool_args = get_oiio_tool_args("oiiotool")
+        max_workers = max(1, min(self.max_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda job: self._run_thumbnail_job(oiio_tool_args, *job),
+                jobs
+            )
+            return {
+                instance_id: thumb_path
+                for instance_id, thumb_path in results
+            }
+
+    def get_thumbnail_job(self, instance):
+        """Get input of thumbnail render from otio clip of instance.
+
+        Returns:
+            Optional[tuple[str, str, Optional[int], str]]: instance id,
+                input path, movie frame index and output path or None if
+                media reference is not supported
+        """
+        otio_clip = instance.data.get("otioClip")
+        if otio_clip is None:
+            return None
+
+        media_reference = otio_clip.media_reference
+        available_range = media_reference.available_range
+        if available_range is None:
+            return None
+
+        # get thumbnail frame from the middle
+        source_range = otio_clip.source_range
+        thumb_frame = int(
+            source_range.start_time.to_frames()
+            + (source_range.duration.to_frames() / 2)
+        )
+        frame_index = thumb_frame - available_range.start_time.to_frames()
+
+        image_sequence_reference = getattr(
+            otio.schema, "ImageSequenceReference", None)
+        if (
+            image_sequence_reference is not None
+            and isinstance(media_reference, image_sequence_reference)
+        ):
+            input_path = media_reference.abs_target_url_for_image_number(
+                frame_index)
+            frame_index = None
+        elif isinstance(media_reference, otio.schema.ExternalReference):
+            input_path = media_reference.target_url
+            ext = os.path.splitext(input_path)[1][1:].lower()
+            if ext in self.movie_extensions:
+                pass
+            elif "%" in input_path or "#" in input_path:
+                # sequence referenced by old otio
+                return None
+            else:
+                frame_index = None
+        else:
+            return None
+
+        if not os.path.exists(input_path):
+            return None
+
+        thumb_file = "{}thumbnail{}{}".format(
+            otio_clip.name, thumb_frame, ".png")
+        thumb_path = os.path.join(self.staging_dir(instance), thumb_file)
+        return instance.id, input_path, frame_index, thumb_path
+
+    def _run_thumbnail_job(
+        self, oiio_tool_args, instance_id, input_path, frame_index, thumb_path
+    ):
+        args = list(oiio_tool_args)
+        if frame_index is not None:
+            args.extend(["--subimage", str(frame_index)])
+
+        args.append(input_path)
+        if input_path.lower().endswith(".exr"):
+            args.extend(["--powc", "0.45,0.45,0.45,1.0"])
+        args.extend(["-o", thumb_path])
+
+        try:
+            run_subprocess(args)
+        except RuntimeError:
+            self.log.debug(
+                "oiiotool failed to render thumbnail of {}".format(
+                    input_path),
+                exc_info=True
+            )
+            return instance_id, None
+
+        if not os.path.exists(thumb_path):
+            return instance_id, None
+        return instance_id, thumb_path
+
+    def _add_representation(self, instance, staging_dir, thumb_file):
+        thumb_representation = {
+            'files': thumb_file,
+            'stagingDir': staging_dir,
+            'name': "thumbnail",
+            'thumbnail': True,
+            'ext': "png"
+        }
+        instance.data["representations"].append(
+            thumb_representation)
+
     def create_thumbnail(self, staging_dir, instance):
         track_item = instance.data["trackItem"]
         track_item_name = track_item.name()
@@ -41,6 +217,68 @@ class ExtractThumbnail(publish.Extractor):
             track_item_name, thumb_frame, ".png")
         thumb_path = os.path.join(staging_dir, thumb_file)
 
+        cache = None
+        if self.use_cache:
+            cache = thumbnail_cache.get_thumbnail_cache(
+                self.cache_max_size_mb * 1024 * 1024)
+
+        if cache is not None and self._get_cached_thumbnail(
+                cache, track_item, thumb_frame, thumb_path):
+            self.log.debug(
+                "__ thumb_path: `{}`, frame: `{}` reused from cache".format(
+                    thumb_path, thumb_frame))
+        elif not self._render_thumbnail(
+                cache, track_item, thumb_frame, thumb_path):
+            return
+
+        self.log.info("Thumbnail was generated to: {}".format(thumb_path))
+        self._add_representation(instance, staging_dir, thumb_file)
+
+    @classmethod
+    def _get_cache_key(cls, track_item, thumb_frame, layer_name):
+        media_source = track_item.source().mediaSource()
+        media_path = media_source.fileinfos()[0].filename()
+        return thumbnail_cache.ThumbnailCache.get_key(
+            media_path,
+            thumb_frame,
+            track_item.sourceMediaColourTransform(),
+            layer_name,
+            media_file=cls._get_media_file(
+                media_source, media_path, thumb_frame)
+        )
+
+    @staticmethod
+    def _get_media_file(media_source, media_path, thumb_frame):
+        """Get file of media containing thumbnail frame.
+
+        Returns:
+            str: frame file of image sequence or media path of movie
+        """
+        if media_source.singleFile():
+            return media_path
+
+        dirname, basename = os.path.split(media_path)
+        pattern, padding = lib.get_sequence_pattern_and_padding(basename)
+        if not pattern:
+            return media_path
+
+        file_frame = str(
+            int(media_source.startTime() + thumb_frame)).zfill(padding)
+        head, _, tail = basename.rpartition(pattern)
+        return os.path.join(dirname, head + file_frame + tail)
+
+    def _get_cached_thumbnail(
+        self, cache, track_item, thumb_frame, thumb_path
+    ):
+        for layer_name in ("rgb", "colour"):
+            cached_path = cache.get(
+                self._get_cache_key(track_item, thumb_frame, layer_name))
+            if cached_path:
+                thumbnail_cache.link_or_copy(cached_path, thumb_path)
+                return True
+        return False
+
+    def _render_thumbnail(self, cache, track_item, thumb_frame, thumb_path):
         # Hiero > 16.0 changed thumbnail default layer from "colour" to "rgb".
         qimage = None
         for layer_name in ("rgb", "colour"):
@@ -57,7 +295,7 @@ class ExtractThumbnail(publish.Extractor):
                 f"{track_item}. This might happen when the edit comes "
                 "from a previous Hiero version."
             )
-            return
+            return False
 
         thumbnail = qimage.save(
             thumb_path,
@@ -66,13 +304,9 @@ class ExtractThumbnail(publish.Extractor):
         self.log.debug(
             "__ thumb_path: `{}`, frame: `{}`".format(thumbnail, thumb_frame))
 
-        self.log.info("Thumbnail was generated to: {}".format(thumb_path))
-        thumb_representation = {
-            'files': thumb_file,
-            'stagingDir': staging_dir,
-            'name': "thumbnail",
-            'thumbnail': True,
-            'ext': "png"
-        }
-        instance.data["representations"].append(
-            thumb_representation)
+        if cache is not None and thumbnail:
+            cache.add(
+                self._get_cache_key(track_item, thumb_frame, layer_name),
+                thumb_path
+            )
+        return True
@@ -15,11 +15,39 @@ class LoadClipModel(BaseSettingsModel):
     )
 
 
+class LoadEffectsModel(BaseSettingsModel):
+    enabled: bool = SettingsField(
+        True,
+        title="Enabled"
+    )
+    reduce_keyframes: bool = SettingsField(
+        True,
+        title="Reduce animation keyframes",
+        description=(
+            "Collapse runs of constant or linearly changing animated"
+            " values to keyframes on their boundaries."
+        )
+    )
+    keyframe_tolerance: float = SettingsField(
+        0.0001,
+        ge=0.0,
+        title="Keyframe tolerance",
+        description=(
+            "Maximal difference of dropped animation value"
+            " from interpolated value."
+        )
+    )
+
+
 class LoaderPluginsModel(BaseSettingsModel):
     LoadClip: LoadClipModel = SettingsField(
         default_factory=LoadClipModel,
         title="Load Clip"
     )
+    LoadEffects: LoadEffectsModel = SettingsField(
+        default_factory=LoadEffectsModel,
+        title="Load Effects"
+    )
 
 
 DEFAULT_LOADER_PLUGINS_SETTINGS = {
@@ -33,5 +61,10 @@ DEFAULT_LOADER_PLUGINS_SETTINGS = {
             "review"
         ],
         "clip_name_template": "{folder[name]}_{product[name]}_{representation}"
+    },
+    "LoadEffects": {
+        "enabled": True,
+        "reduce_keyframes": True,
+        "keyframe_tolerance": 0.0001
     }
 }
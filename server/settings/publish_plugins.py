@@ -41,16 +41,138 @@ class CollectClipEffectsModel(BaseSettingsModel):
         return value
 
 
+class CollectOTIOTimelineModel(BaseSettingsModel):
+    partial_export: bool = SettingsField(
+        True,
+        title="Export only tracks and ranges used by instances",
+        description=(
+            "Convert only tracks and frame ranges of the active timeline"
+            " which are needed by publish instances."
+        )
+    )
+
+
+class ExtractFramesModel(BaseSettingsModel):
+    max_workers: int = SettingsField(
+        4,
+        ge=1,
+        title="Max concurrent oiiotool processes",
+        description=(
+            "Frames are extracted per source media in parallel."
+            " Set to 1 to extract sources one after another."
+        )
+    )
+
+
+def thumbnail_mode_enum():
+    return [
+        {"value": "hiero", "label": "Render in Hiero"},
+        {"value": "oiiotool", "label": "Render from media with oiiotool"},
+    ]
+
+
+class ExtractThumbnailModel(BaseSettingsModel):
+    use_cache: bool = SettingsField(
+        True,
+        title="Cache thumbnails",
+        description=(
+            "Reuse thumbnails rendered by previous publishes"
+            " of unchanged media."
+        )
+    )
+    cache_max_size_mb: int = SettingsField(
+        512,
+        ge=1,
+        title="Max thumbnail cache size (MB)"
+    )
+    thumbnail_mode: str = SettingsField(
+        "hiero",
+        title="Thumbnail mode",
+        description=(
+            "Render thumbnails of all instances from their media with"
+            " parallel oiiotool processes. Media oiiotool can't read"
+            " are rendered in Hiero."
+        ),
+        enum_resolver=thumbnail_mode_enum
+    )
+    max_workers: int = SettingsField(
+        4,
+        ge=1,
+        title="Max concurrent oiiotool processes"
+    )
+
+
+def effects_schema_version_enum():
+    return [
+        {"value": 1, "label": "1 - value per frame"},
+        {"value": 2, "label": "2 - keyframes"},
+    ]
+
+
+class ExtractClipEffectsModel(BaseSettingsModel):
+    schema_version: int = SettingsField(
+        1,
+        title="Effects json schema version",
+        description=(
+            "Version 2 stores animated knobs as keyframes and is smaller"
+            " to publish and faster to load. Loaders of other hosts"
+            " might support only version 1."
+        ),
+        enum_resolver=effects_schema_version_enum
+    )
+    keyframe_tolerance: float = SettingsField(
+        0.0001,
+        ge=0.0,
+        title="Keyframe tolerance",
+        description=(
+            "Maximal difference of dropped animation value"
+            " from interpolated value."
+        )
+    )
+
+
 class PublishPluginsModel(BaseSettingsModel):
+    CollectOTIOTimeline: CollectOTIOTimelineModel = SettingsField(
+        default_factory=CollectOTIOTimelineModel,
+        title="Collect OTIO Timeline"
+    )
     CollectClipEffects: CollectClipEffectsModel = SettingsField(
         default_factory=CollectClipEffectsModel,
         title="Collect Clip Effects"
     )
+    ExtractClipEffects: ExtractClipEffectsModel = SettingsField(
+        default_factory=ExtractClipEffectsModel,
+        title="Extract Clip Effects"
+    )
+    ExtractFrames: ExtractFramesModel = SettingsField(
+        default_factory=ExtractFramesModel,
+        title="Extract Frames"
+    )
+    ExtractThumbnail: ExtractThumbnailModel = SettingsField(
+        default_factory=ExtractThumbnailModel,
+        title="Extract Thumbnail"
+    )
 
 
 DEFAULT_PUBLISH_PLUGIN_SETTINGS = {
+    "CollectOTIOTimeline": {
+        "partial_export": True
+    },
     "CollectClipEffectsModel": {
         "effect_categories": [],
         "effect_tracks": []
+    },
+    "ExtractClipEffects": {
+        "schema_version": 1,
+        "keyframe_tolerance": 0.0001
+    },
+    "ExtractFrames": {
+        "max_workers": 4
+    },
+    "ExtractThumbnail": {
+        "use_cache": True,
+        "cache_max_size_mb": 512,
+        "thumbnail_mode": "hiero",
+        "max_workers": 4
     }
 }